@@ -0,0 +1,311 @@
+"""
+Personal Finance Chatbot - Quart API Server
+Serves the web frontend and exposes the chat API used by it
+"""
+
+import asyncio
+import hashlib
+import json
+import mimetypes
+import os
+import re
+import datetime
+
+from quart import Quart, Response, abort, request, jsonify
+from quart_cors import cors
+import uvicorn
+from dotenv import load_dotenv
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+from backend.openai_api import OpenAIHandler
+from backend.google_nlu_api import GoogleNLUHandler
+from backend.utils import FinanceUtils
+
+# Load environment variables
+load_dotenv()
+
+app = Quart(__name__)
+app = cors(app)
+
+# Frontend assets directory
+FRONTEND_DIR = os.path.join(os.path.dirname(__file__), 'frontend')
+
+# Only genuine web assets are served; anything else under frontend/
+# (application source, bytecode caches, hash sidecars) stays private
+_ASSET_EXTENSIONS = frozenset({
+    '.html', '.css', '.js', '.json',
+    '.png', '.jpg', '.jpeg', '.gif', '.svg', '.ico', '.webp',
+    '.woff', '.woff2',
+})
+
+
+def _load_static_files() -> dict:
+    """Read the frontend web assets into memory once at startup"""
+    files = {}
+    for root, dirs, names in os.walk(FRONTEND_DIR):
+        dirs[:] = [d for d in dirs if not d.startswith('.') and d != '__pycache__']
+        for name in names:
+            if os.path.splitext(name)[1].lower() not in _ASSET_EXTENSIONS:
+                continue
+            path = os.path.join(root, name)
+            rel = os.path.relpath(path, FRONTEND_DIR).replace(os.sep, '/')
+            mimetype = mimetypes.guess_type(name)[0] or 'application/octet-stream'
+            with open(path, 'rb') as f:
+                body = f.read()
+            # ETags are computed once here so conditional requests cost
+            # a dict lookup and a string compare
+            files[rel] = (body, mimetype, hashlib.md5(body).hexdigest())
+    return files
+
+
+# Static assets served straight from memory, keeping disk IO off the
+# request path entirely
+_STATIC_FILES = _load_static_files()
+
+# API handlers are constructed on first use so cold start doesn't pay
+# for OpenAI/gRPC client setup before the first request needs it
+_openai_handler = None
+_google_handler = None
+
+
+def _get_openai_handler() -> OpenAIHandler:
+    """Create the OpenAI handler on first use"""
+    global _openai_handler
+    if _openai_handler is None:
+        _openai_handler = OpenAIHandler()
+    return _openai_handler
+
+
+def _get_google_handler() -> GoogleNLUHandler:
+    """Create the Google NLU handler (and its batch worker) on first use"""
+    global _google_handler
+    if _google_handler is None:
+        _google_handler = GoogleNLUHandler()
+        _google_handler.warm_connection()
+        try:
+            _google_handler.start_batch_worker()
+            asyncio.create_task(_google_handler.warm_connection_async())
+        except RuntimeError:
+            # No running event loop; requests fall back to unbatched calls
+            pass
+    return _google_handler
+
+# Fallback topics and their trigger keywords, matched in one pass through
+# a single alternation pattern built at import
+_FALLBACK_KEYWORDS = {
+    'budget': ['budget', 'budgeting'],
+    'investing': ['invest', 'investment'],
+    'debt': ['debt', 'loan'],
+    'saving': ['save', 'saving'],
+}
+
+_KEYWORD_TO_TOPIC = {
+    keyword: topic
+    for topic, keywords in _FALLBACK_KEYWORDS.items()
+    for keyword in keywords
+}
+
+_FALLBACK_RE = re.compile('|'.join(sorted(_KEYWORD_TO_TOPIC, key=len, reverse=True)))
+
+# Canned replies built once at import rather than per call
+_FALLBACK_RESPONSES = {
+    'budget': ("Creating a budget is essential for financial health! Here's a simple approach:\n\n"
+               "• Track your income and expenses for a month\n"
+               "• Use the 50/30/20 rule: 50% needs, 30% wants, 20% savings\n"
+               "• Start with essential categories: housing, food, transportation\n"
+               "• Set realistic savings goals\n\n"
+               "Would you like help with any specific budgeting category?"),
+    'investing': ("Great question about investing! For beginners, consider:\n\n"
+                  "• Start with an emergency fund (3-6 months expenses)\n"
+                  "• Consider low-cost index funds or ETFs\n"
+                  "• Take advantage of employer 401(k) matching\n"
+                  "• Diversify your portfolio\n\n"
+                  "Remember: invest only what you can afford to lose!"),
+    'debt': ("Managing debt effectively is crucial! Here's my advice:\n\n"
+             "• List all debts with balances and interest rates\n"
+             "• Pay minimums on all debts\n"
+             "• Use debt avalanche (highest interest first) or snowball (smallest balance first)\n"
+             "• Avoid taking on new debt while paying off existing debt\n\n"
+             "Would you like help prioritizing your specific debts?"),
+    'saving': ("Smart saving strategies can accelerate your financial goals:\n\n"
+               "• Automate savings - pay yourself first\n"
+               "• Use high-yield savings accounts\n"
+               "• Set specific, measurable savings goals\n"
+               "• Track your progress regularly\n\n"
+               "What are you saving for? I can help you create a plan!"),
+}
+
+_DEFAULT_FALLBACK = ("Thanks for your question! I can help with:\n\n"
+                     "💰 Budgeting and expense tracking\n"
+                     "📈 Investment strategies and portfolio advice\n"
+                     "💳 Debt management and payoff strategies\n"
+                     "🏠 Saving for major purchases\n\n"
+                     "What specific financial topic would you like to explore?")
+
+
+def _json_response(payload, status: int = 200) -> Response:
+    """Serialize a JSON response with orjson when available"""
+    if ORJSON_AVAILABLE:
+        body = orjson.dumps(payload)
+    else:
+        body = json.dumps(payload)
+    return Response(body, status=status, mimetype='application/json')
+
+
+def _parse_json_body(raw: bytes) -> dict:
+    """Deserialize a JSON request body, returning {} on bad input"""
+    try:
+        data = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+    except (ValueError, TypeError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def generate_fallback_response(message: str) -> str:
+    """Generate keyword-based responses when OpenAI isn't configured"""
+    match = _FALLBACK_RE.search(message.casefold())
+    if match:
+        return _FALLBACK_RESPONSES[_KEYWORD_TO_TOPIC[match.group()]]
+    return _DEFAULT_FALLBACK
+
+
+@app.route('/chat', methods=['POST'])
+async def chat():
+    """Handle chat messages with parallel sentiment + completion calls"""
+    data = _parse_json_body(await request.get_data())
+    message = (data.get('message') or '').strip()
+
+    if not message:
+        return _json_response({"error": "Message is required"}, status=400)
+
+    # Amount extraction is pure CPU, run it before the network calls
+    amounts = FinanceUtils.extract_amounts(message)
+
+    openai_handler = _get_openai_handler()
+    google_handler = _get_google_handler()
+
+    try:
+        # Run sentiment analysis and response generation concurrently so
+        # wall time is max(sentiment, openai) instead of their sum
+        sentiment_task = asyncio.create_task(
+            google_handler.analyze_sentiment_batched(message)
+        )
+        if openai_handler.api_key:
+            ai_task = asyncio.create_task(
+                openai_handler.get_financial_advice_async(message)
+            )
+            sentiment, response = await asyncio.gather(sentiment_task, ai_task)
+        else:
+            response = generate_fallback_response(message)
+            sentiment = await sentiment_task
+
+        return _json_response({
+            "response": response,
+            "sentiment": sentiment,
+            "amounts": amounts,
+            "timestamp": datetime.datetime.now().isoformat()
+        })
+
+    except Exception as e:
+        return _json_response({"error": f"Failed to process message: {str(e)}"}, status=500)
+
+
+@app.route('/chat/stream', methods=['POST'])
+async def chat_stream():
+    """Stream the reply as Server-Sent Events so tokens render as they arrive"""
+    data = _parse_json_body(await request.get_data())
+    message = (data.get('message') or '').strip()
+
+    if not message:
+        return _json_response({"error": "Message is required"}, status=400)
+
+    amounts = FinanceUtils.extract_amounts(message)
+    openai_handler = _get_openai_handler()
+
+    async def stream():
+        # Tokens are JSON-encoded so embedded newlines can't break SSE framing
+        if openai_handler.api_key:
+            async for token in openai_handler.stream_financial_advice(message):
+                yield f"data: {json.dumps(token)}\n\n"
+        else:
+            yield f"data: {json.dumps(generate_fallback_response(message))}\n\n"
+
+        yield f"event: done\ndata: {json.dumps({'amounts': amounts})}\n\n"
+
+    return Response(stream(), mimetype='text/event-stream')
+
+
+@app.route('/cache/stats')
+async def cache_stats():
+    """Expose hit/miss statistics for the response caches"""
+    return jsonify({
+        "openai_advice": OpenAIHandler.cache_stats(),
+        "google_sentiment": GoogleNLUHandler.cache_stats()
+    })
+
+
+@app.route('/health')
+async def health():
+    """Health check endpoint"""
+    response = _json_response({
+        "status": "healthy",
+        "openai_available": bool(_get_openai_handler().api_key),
+        "google_nlu_available": _get_google_handler().client is not None
+    })
+
+    # Monitoring pollers hit this endpoint constantly; an ETag lets them
+    # get cheap 304s while the payload is unchanged
+    etag = hashlib.md5(await response.get_data()).hexdigest()
+    if etag in request.if_none_match:
+        return Response(status=304)
+
+    response.set_etag(etag)
+    return response
+
+
+@app.route('/')
+async def index():
+    """Serve the frontend entry page"""
+    return await serve_static('demo.html')
+
+
+@app.route('/<path:filename>')
+async def serve_static(filename):
+    """Serve static frontend assets from the in-memory store"""
+    entry = _STATIC_FILES.get(filename)
+    if entry is None:
+        abort(404)
+
+    body, mimetype, etag = entry
+    if etag in request.if_none_match:
+        return Response(status=304)
+
+    response = Response(body, mimetype=mimetype)
+    response.headers['Cache-Control'] = 'public, max-age=3600'
+    response.set_etag(etag)
+    return response
+
+
+if __name__ == '__main__':
+    port = int(os.getenv('PORT', 8000))
+
+    if os.getenv('USE_GUNICORN'):
+        # Production path: multiple uvicorn workers under gunicorn so the
+        # IO-bound chat load overlaps across processes
+        workers = os.getenv('WEB_CONCURRENCY') or str(os.cpu_count() or 2)
+        os.execvp('gunicorn', [
+            'gunicorn', 'api_server:app',
+            '-k', 'uvicorn.workers.UvicornWorker',
+            '-w', workers,
+            '-b', f'0.0.0.0:{port}',
+            '--timeout', '120',
+        ])
+
+    print("🚀 Starting Personal Finance Chatbot API Server")
+    print(f"📱 Open your browser to: http://localhost:{port}")
+    uvicorn.run("api_server:app", host='0.0.0.0', port=port)
@@ -2,25 +2,62 @@
 OpenAI API integration for personal finance chatbot
 """
 
+import asyncio
 import os
-import openai
+import random
 from typing import Dict, List
 
+from .cache import TTLCache, normalize_key
+
+# The openai package (and its httpx stack) is imported lazily on first
+# handler construction so workers that never call OpenAI don't pay the
+# import cost at boot
+openai = None
+
+
+def _import_openai():
+    """Import openai and httpx on first use"""
+    global openai
+    if openai is None:
+        import openai as _openai
+        openai = _openai
+    return openai
+
+# Cache completed advice responses so repeated prompts skip the API round-trip
+_advice_cache = TTLCache(maxsize=1024, ttl=3600)
+
+# Cap in-flight completions so request bursts don't trip 429 rate limits
+_SEM = asyncio.Semaphore(int(os.getenv('OPENAI_MAX_CONCURRENCY', '20')))
+_MAX_RETRIES = 5
+
 class OpenAIHandler:
     """Handle OpenAI API interactions"""
     
     def __init__(self):
         self.api_key = os.getenv('OPENAI_API_KEY')
+        self.client = None
+        self.aclient = None
         if self.api_key:
-            openai.api_key = self.api_key
+            import httpx
+            _import_openai()
+
+            # One client per handler keeps a warm keep-alive connection pool
+            # instead of paying a TLS handshake on every request
+            self.client = openai.OpenAI(api_key=self.api_key)
+            self.aclient = openai.AsyncOpenAI(
+                api_key=self.api_key,
+                http_client=httpx.AsyncClient(
+                    limits=httpx.Limits(max_connections=100, max_keepalive_connections=50)
+                )
+            )
     
     def generate_response(self, messages: List[Dict[str, str]], model: str = "gpt-3.5-turbo") -> str:
         """Generate response using OpenAI API"""
         try:
-            if not self.api_key:
+            if not self.client:
                 return "OpenAI API key not configured. Please check your environment variables."
-            
-            response = openai.chat.completions.create(
+
+            response = self.client.chat.completions.create(
                 model=model,
                 messages=messages,
                 max_tokens=500,
@@ -32,19 +69,93 @@ class OpenAIHandler:
         except Exception as e:
             return f"Error generating response: {str(e)}"
     
+    async def generate_response_async(self, messages: List[Dict[str, str]], model: str = "gpt-3.5-turbo") -> str:
+        """Generate response using the async OpenAI API"""
+        try:
+            if not self.aclient:
+                return "OpenAI API key not configured. Please check your environment variables."
+
+            async with _SEM:
+                for attempt in range(_MAX_RETRIES):
+                    try:
+                        response = await self.aclient.chat.completions.create(
+                            model=model,
+                            messages=messages,
+                            max_tokens=500,
+                            temperature=0.7
+                        )
+                        break
+                    except openai.RateLimitError:
+                        if attempt == _MAX_RETRIES - 1:
+                            raise
+                        # Exponential backoff with jitter before retrying
+                        await asyncio.sleep(min(30.0, 2.0 ** attempt * (1.0 + random.random())))
+
+            return response.choices[0].message.content
+
+        except Exception as e:
+            return f"Error generating response: {str(e)}"
+
     def get_financial_advice(self, query: str) -> str:
         """Get financial advice for a specific query"""
+        cache_key = normalize_key(query)
+        cached = _advice_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        response = self.generate_response(self._build_advice_messages(query))
+        if not response.startswith("Error generating response"):
+            _advice_cache.set(cache_key, response)
+        return response
+
+    async def get_financial_advice_async(self, query: str) -> str:
+        """Get financial advice for a specific query without blocking the event loop"""
+        cache_key = normalize_key(query)
+        cached = _advice_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        response = await self.generate_response_async(self._build_advice_messages(query))
+        if not response.startswith("Error generating response"):
+            _advice_cache.set(cache_key, response)
+        return response
+
+    async def stream_financial_advice(self, query: str, model: str = "gpt-3.5-turbo"):
+        """Yield advice tokens as they arrive instead of buffering the reply"""
+        if not self.aclient:
+            yield "OpenAI API key not configured. Please check your environment variables."
+            return
+
+        async with _SEM:
+            stream = await self.aclient.chat.completions.create(
+                model=model,
+                messages=self._build_advice_messages(query),
+                max_tokens=500,
+                temperature=0.7,
+                stream=True
+            )
+            async for chunk in stream:
+                content = chunk.choices[0].delta.content
+                if content:
+                    yield content
+
+    @staticmethod
+    def cache_stats() -> Dict:
+        """Return statistics for the advice response cache"""
+        return _advice_cache.stats()
+
+    def _build_advice_messages(self, query: str) -> List[Dict[str, str]]:
+        """Build the chat messages for a financial advice request"""
         system_message = {
             "role": "system",
-            "content": """You are a helpful personal finance assistant. 
+            "content": """You are a helpful personal finance assistant.
             Provide clear, practical financial advice. Be concise but comprehensive.
             Always remind users to consult with financial professionals for major decisions."""
         }
-        
+
         user_message = {
-            "role": "user", 
+            "role": "user",
             "content": query
         }
-        
-        messages = [system_message, user_message]
-        return self.generate_response(messages)
+
+        return [system_message, user_message]
@@ -2,84 +2,229 @@
 Utility functions for personal finance chatbot
 """
 
+import math
 import re
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Patterns compiled once at import; these run on every chat message
+_AMOUNT_RE = re.compile(r'\$?(\d+(?:,\d{3})*(?:\.\d{2})?)')
+_PCT_RE = re.compile(r'\d+(?:\.\d+)?%')
+_DATE_RE = re.compile(r'\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\b')
+
+# Translation table that strips thousands separators
+_STRIP_COMMAS = str.maketrans('', '', ',')
+
+# Expense categories and their trigger keywords, in priority order
+_EXPENSE_CATEGORIES = {
+    'food': ['restaurant', 'grocery', 'food', 'dining', 'coffee', 'lunch', 'dinner'],
+    'transportation': ['gas', 'uber', 'taxi', 'bus', 'train', 'parking', 'car'],
+    'entertainment': ['movie', 'concert', 'game', 'entertainment', 'streaming'],
+    'shopping': ['amazon', 'store', 'mall', 'shopping', 'clothes', 'electronics'],
+    'utilities': ['electric', 'water', 'internet', 'phone', 'utility'],
+    'healthcare': ['doctor', 'hospital', 'pharmacy', 'medical', 'dentist']
+}
+
+# One alternation pattern scans a message in a single pass regardless of
+# how many keywords are registered
+_KEYWORD_TO_CATEGORY = {}
+_CATEGORY_PRIORITY = {}
+for _priority, (_category, _keywords) in enumerate(_EXPENSE_CATEGORIES.items()):
+    _CATEGORY_PRIORITY[_category] = _priority
+    for _keyword in _keywords:
+        _KEYWORD_TO_CATEGORY[_keyword] = _category
+
+_EXPENSE_RE = re.compile(
+    r'\b(?:'
+    + '|'.join(sorted(map(re.escape, _KEYWORD_TO_CATEGORY), key=len, reverse=True))
+    + r')\b'
+)
+
+
+# Inserts thousands separators into an already fixed-decimal string
+_COMMA_RE = re.compile(r'(?<=\d)(?=(?:\d{3})+\.)')
+
+
+@lru_cache(maxsize=4096)
+def _format_currency_cached(amount: float) -> str:
+    """Format an amount as currency; common amounts repeat across users"""
+    return f"${amount:,.2f}"
+
 class FinanceUtils:
     """Utility functions for financial calculations and text processing"""
     
     @staticmethod
     def extract_amounts(text: str) -> List[float]:
         """Extract monetary amounts from text"""
-        # Pattern to match currency amounts
-        pattern = r'\$?(\d+(?:,\d{3})*(?:\.\d{2})?)'
-        matches = re.findall(pattern, text)
-        
         amounts = []
-        for match in matches:
+        for match in _AMOUNT_RE.findall(text):
             try:
                 # Remove commas and convert to float
-                amount = float(match.replace(',', ''))
+                amount = float(match.translate(_STRIP_COMMAS))
                 amounts.append(amount)
             except ValueError:
                 continue
-        
+
         return amounts
     
+    @staticmethod
+    def extract_amount_spans(text: str) -> List[Tuple[int, int, float]]:
+        """Extract monetary amounts along with their (start, end) positions
+
+        Callers that highlight or annotate amounts can slice the original
+        text by span instead of re-finding each value.
+        """
+        spans = []
+        for match in _AMOUNT_RE.finditer(text):
+            try:
+                value = float(match.group(1).translate(_STRIP_COMMAS))
+            except ValueError:
+                continue
+            spans.append((match.start(), match.end(), value))
+
+        return spans
+
+    @staticmethod
+    def extract_amounts_batch(texts: List[str]) -> List[List[float]]:
+        """Extract monetary amounts from many texts in one regex pass"""
+        if not texts:
+            return []
+
+        # Join with a sentinel the amount pattern can never match across,
+        # recording where each text starts in the combined string
+        joined = '\x00'.join(texts)
+        offsets = []
+        position = 0
+        for text in texts:
+            offsets.append(position)
+            position += len(text) + 1
+
+        matches = list(_AMOUNT_RE.finditer(joined))
+
+        # Parse all matched amounts in a single C-level call when possible
+        if NUMPY_AVAILABLE and matches:
+            values = np.char.replace(
+                np.array([m.group(1) for m in matches], dtype='U'), ',', ''
+            ).astype(np.float64).tolist()
+        else:
+            values = [float(m.group(1).translate(_STRIP_COMMAS)) for m in matches]
+
+        results: List[List[float]] = [[] for _ in texts]
+        index = 0
+        for match, value in zip(matches, values):
+            start = match.start()
+            while index + 1 < len(offsets) and start >= offsets[index + 1]:
+                index += 1
+            results[index].append(value)
+
+        return results
+
     @staticmethod
     def format_currency(amount: float) -> str:
         """Format amount as currency"""
-        return f"${amount:,.2f}"
+        return _format_currency_cached(amount)
+
+    @staticmethod
+    def format_currency_batch(amounts: List[float]) -> List[str]:
+        """Format many amounts as currency, vectorizing the decimal step"""
+        if not NUMPY_AVAILABLE:
+            return [_format_currency_cached(amount) for amount in amounts]
+
+        fixed = np.char.mod('%.2f', np.asarray(amounts, dtype=np.float64))
+        return ['$' + _COMMA_RE.sub(',', text) for text in fixed.tolist()]
     
     @staticmethod
-    def calculate_compound_interest(principal: float, rate: float, time: float, 
+    def calculate_compound_interest(principal: float, rate: float, time: float,
                                   compound_frequency: int = 12) -> float:
         """Calculate compound interest"""
-        amount = principal * (1 + rate / compound_frequency) ** (compound_frequency * time)
+        periods = compound_frequency * time
+        amount = principal * math.pow(1.0 + rate / compound_frequency, periods)
         return round(amount, 2)
-    
+
+    @staticmethod
+    def calculate_compound_interest_batch(principals: List[float], rate: float, time: float,
+                                          compound_frequency: int = 12) -> List[float]:
+        """Calculate compound interest for many principals in one pass"""
+        if not NUMPY_AVAILABLE:
+            return [
+                FinanceUtils.calculate_compound_interest(principal, rate, time, compound_frequency)
+                for principal in principals
+            ]
+
+        # The growth factor is shared, so the batch is one multiply
+        growth = math.pow(1.0 + rate / compound_frequency, compound_frequency * time)
+        amounts = np.asarray(principals, dtype=np.float64) * growth
+        return np.round(amounts, 2).tolist()
+
     @staticmethod
     def calculate_monthly_payment(loan_amount: float, annual_rate: float, years: int) -> float:
         """Calculate monthly loan payment using standard formula"""
         monthly_rate = annual_rate / 12
         num_payments = years * 12
-        
+
         if monthly_rate == 0:
             return loan_amount / num_payments
-        
-        payment = loan_amount * (monthly_rate * (1 + monthly_rate) ** num_payments) / \
-                 ((1 + monthly_rate) ** num_payments - 1)
-        
+
+        # Compute the growth factor once instead of twice
+        growth = math.pow(1.0 + monthly_rate, num_payments)
+        payment = loan_amount * monthly_rate * growth / (growth - 1.0)
+
         return round(payment, 2)
+
+    @staticmethod
+    def calculate_monthly_payment_batch(loan_amounts: List[float], annual_rate: float,
+                                        years: int) -> List[float]:
+        """Calculate monthly payments for many loan amounts in one pass"""
+        if not NUMPY_AVAILABLE:
+            return [
+                FinanceUtils.calculate_monthly_payment(amount, annual_rate, years)
+                for amount in loan_amounts
+            ]
+
+        monthly_rate = annual_rate / 12
+        num_payments = years * 12
+        amounts = np.asarray(loan_amounts, dtype=np.float64)
+
+        # The scalar helper leaves the zero-rate quotient unrounded;
+        # keep the batch identical so results don't depend on NumPy
+        if monthly_rate == 0:
+            return (amounts / num_payments).tolist()
+
+        growth = math.pow(1.0 + monthly_rate, num_payments)
+        payments = amounts * (monthly_rate * growth / (growth - 1.0))
+        return np.round(payments, 2).tolist()
     
     @staticmethod
     def categorize_expense(text: str) -> str:
         """Categorize expense based on keywords in text"""
-        text_lower = text.lower()
-        
-        categories = {
-            'food': ['restaurant', 'grocery', 'food', 'dining', 'coffee', 'lunch', 'dinner'],
-            'transportation': ['gas', 'uber', 'taxi', 'bus', 'train', 'parking', 'car'],
-            'entertainment': ['movie', 'concert', 'game', 'entertainment', 'streaming'],
-            'shopping': ['amazon', 'store', 'mall', 'shopping', 'clothes', 'electronics'],
-            'utilities': ['electric', 'water', 'internet', 'phone', 'utility'],
-            'healthcare': ['doctor', 'hospital', 'pharmacy', 'medical', 'dentist']
-        }
-        
-        for category, keywords in categories.items():
-            if any(keyword in text_lower for keyword in keywords):
-                return category
-        
-        return 'other'
+        text_lower = text.casefold()
+
+        best_category = None
+        best_priority = len(_CATEGORY_PRIORITY)
+        for match in _EXPENSE_RE.finditer(text_lower):
+            category = _KEYWORD_TO_CATEGORY[match.group()]
+            priority = _CATEGORY_PRIORITY[category]
+            if priority < best_priority:
+                best_category, best_priority = category, priority
+                if priority == 0:
+                    break
+
+        return best_category or 'other'
     
     @staticmethod
     def validate_financial_input(text: str) -> Dict[str, bool]:
         """Validate if text contains financial information"""
         return {
-            'has_amount': bool(re.search(r'\$?\d+(?:,\d{3})*(?:\.\d{2})?', text)),
-            'has_percentage': bool(re.search(r'\d+(?:\.\d+)?%', text)),
-            'has_date': bool(re.search(r'\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\b', text)),
+            'has_amount': bool(_AMOUNT_RE.search(text)),
+            'has_percentage': bool(_PCT_RE.search(text)),
+            'has_date': bool(_DATE_RE.search(text)),
         }
 
 # Standalone functions for easier importing
@@ -87,15 +232,32 @@ def extract_amounts(text: str) -> List[float]:
     """Extract monetary amounts from text"""
     return FinanceUtils.extract_amounts(text)
 
+def extract_amount_spans(text: str) -> List[Tuple[int, int, float]]:
+    """Extract monetary amounts along with their (start, end) positions"""
+    return FinanceUtils.extract_amount_spans(text)
+
+def extract_amounts_batch(texts: List[str]) -> List[List[float]]:
+    """Extract monetary amounts from many texts in one regex pass"""
+    return FinanceUtils.extract_amounts_batch(texts)
+
 def format_currency(amount: float) -> str:
     """Format amount as currency"""
     return FinanceUtils.format_currency(amount)
 
-def calculate_compound_interest(principal: float, rate: float, time: float, 
+def format_currency_batch(amounts: List[float]) -> List[str]:
+    """Format many amounts as currency, vectorizing the decimal step"""
+    return FinanceUtils.format_currency_batch(amounts)
+
+def calculate_compound_interest(principal: float, rate: float, time: float,
                               compound_frequency: int = 12) -> float:
     """Calculate compound interest"""
     return FinanceUtils.calculate_compound_interest(principal, rate, time, compound_frequency)
 
+def calculate_compound_interest_batch(principals: List[float], rate: float, time: float,
+                                      compound_frequency: int = 12) -> List[float]:
+    """Calculate compound interest for many principals in one pass"""
+    return FinanceUtils.calculate_compound_interest_batch(principals, rate, time, compound_frequency)
+
 def categorize_expense(text: str) -> str:
     """Categorize expense based on keywords in text"""
     return FinanceUtils.categorize_expense(text)
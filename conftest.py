@@ -0,0 +1,13 @@
+"""
+Shared pytest fixtures for the test suite
+"""
+
+import pytest
+
+from backend.utils import FinanceUtils
+
+
+@pytest.fixture(scope="session")
+def utils():
+    """One FinanceUtils instance shared across the whole test session"""
+    return FinanceUtils()
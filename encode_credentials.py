@@ -13,25 +13,25 @@ def encode_credentials(json_file_path):
     for use in environment variables during deployment
     """
     try:
-        with open(json_file_path, 'r') as file:
-            # Read and validate JSON
-            json_content = json.load(file)
-            
-            # Convert back to string for encoding
-            json_string = json.dumps(json_content)
-            
-            # Encode to base64
-            encoded = base64.b64encode(json_string.encode('utf-8')).decode('utf-8')
-            
-            print("✅ Successfully encoded Google Cloud credentials!")
-            print("\nFor Render deployment, set this as your GOOGLE_APPLICATION_CREDENTIALS environment variable:")
-            print("-" * 80)
-            print(encoded)
-            print("-" * 80)
-            print("\nNote: Keep this value secure and don't share it publicly!")
-            
-            return encoded
-            
+        with open(json_file_path, 'rb') as file:
+            raw = file.read()
+
+        # Validate only; the original bytes are encoded as-is so there's
+        # no re-serialization pass
+        json.loads(raw)
+
+        encoded = base64.b64encode(raw).decode('ascii')
+
+        print("✅ Successfully encoded Google Cloud credentials!")
+        print("\nFor Render deployment, set this as your GOOGLE_APPLICATION_CREDENTIALS environment variable:")
+        print("-" * 80)
+        print(encoded)
+        print("-" * 80)
+        print("\nNote: Keep this value secure and don't share it publicly!")
+
+        return encoded
+
+
     except FileNotFoundError:
         print(f"❌ Error: File '{json_file_path}' not found.")
         return None
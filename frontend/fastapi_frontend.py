@@ -3,52 +3,279 @@ Personal Finance Chatbot - FastAPI Python Web Frontend
 Modern web interface built entirely in Python using FastAPI and Jinja2 templates
 """
 
-from fastapi import FastAPI, Request, Form
+from fastapi import FastAPI, Request, Form, WebSocket, WebSocketDisconnect
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import HTMLResponse, RedirectResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 import uvicorn
+import asyncio
+import functools
+import hashlib
+import re
 import sys
 import os
-from typing import List, Dict
+import time
+from collections import deque
+from typing import Deque, List, Dict
 import datetime
 import json
 
-# Add backend to Python path
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'backend'))
+# Make the project root importable so `backend` resolves as a package
+# and every frontend shares one canonical module instance; appending the
+# backend directory itself re-parsed its modules under different names
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
 
 try:
-    from main import PersonalFinanceChatbot
-    from utils import extract_amounts, format_currency
+    from backend.main import PersonalFinanceChatbot
+    from backend.utils import extract_amounts, format_currency
     BACKEND_AVAILABLE = True
 except ImportError:
     BACKEND_AVAILABLE = False
     print("Backend modules not available, running in demo mode")
 
+try:
+    import redis.asyncio as aioredis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+import jinja2
+from jinja2 import FileSystemBytecodeCache
+from markupsafe import escape
+
 # Initialize FastAPI app
 app = FastAPI(title="Personal Finance Chatbot", description="AI-powered financial assistant")
 
-# Create templates directory if it doesn't exist
+# The chat page is mostly repetitive HTML/CSS that compresses 5-10x;
+# tiny responses (JSON status, redirects) are left alone
+app.add_middleware(GZipMiddleware, minimum_size=512)
+
+# Create templates/static directories if they don't exist
 templates_dir = os.path.join(os.path.dirname(__file__), "templates")
+static_dir = os.path.join(os.path.dirname(__file__), "static")
+jinja_cache_dir = os.path.join(templates_dir, ".jinja_cache")
 os.makedirs(templates_dir, exist_ok=True)
+os.makedirs(static_dir, exist_ok=True)
+os.makedirs(jinja_cache_dir, exist_ok=True)
+
+# Bytecode cache keeps the compiled template across process restarts;
+# an explicit Environment is passed because Starlette no longer forwards
+# extra keyword arguments to jinja2
+templates = Jinja2Templates(
+    env=jinja2.Environment(
+        loader=jinja2.FileSystemLoader(templates_dir),
+        autoescape=jinja2.select_autoescape(("html", "htm", "xml")),
+        bytecode_cache=FileSystemBytecodeCache(jinja_cache_dir),
+    )
+)
+
+app.mount("/static", StaticFiles(directory=static_dir), name="static")
+
+
+@app.middleware("http")
+async def add_static_cache_headers(request, call_next):
+    """Let browsers keep static assets instead of re-fetching each visit"""
+    response = await call_next(request)
+    if request.url.path.startswith("/static/"):
+        response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+    return response
+
+# The chatbot is constructed on first use rather than at import, so the
+# process is ready (and healthchecks pass) before backend clients load
+@functools.lru_cache(maxsize=1)
+def get_chatbot():
+    """Build the backend chatbot once, on first request"""
+    if not BACKEND_AVAILABLE:
+        return None
+    return PersonalFinanceChatbot()
+
+
+@app.on_event("startup")
+async def warm_backend_connections():
+    """Prime the backend TLS connections so the first /chat doesn't pay for them
+
+    The OpenAI and Google NLU clients keep pooled connections alive once
+    opened; a cheap probe at startup moves the ~40-100ms handshake off
+    the first user's request.
+    """
+    if not BACKEND_AVAILABLE:
+        return
+
+    def _warm():
+        # Constructing the chatbot here keeps client init off the event
+        # loop while still finishing before real traffic arrives
+        chatbot = get_chatbot()
+        client = getattr(chatbot, "openai_client", None)
+        if client is not None:
+            try:
+                client.models.list()
+            except Exception:
+                # Warming is best-effort; the first real call will connect
+                pass
+        nlu = getattr(chatbot, "nlu_client", None)
+        if nlu is not None and hasattr(nlu, "warm_connection"):
+            try:
+                nlu.warm_connection()
+            except Exception:
+                pass
+
+    # The handshakes block, so run them off the event loop
+    asyncio.get_running_loop().run_in_executor(None, _warm)
+
+class ConversationStore:
+    """Conversation history in Redis when configured, else in memory
+
+    Redis keeps history consistent when uvicorn runs multiple workers
+    and survives restarts; the in-memory dict remains the
+    single-process fallback when REDIS_URL isn't set.
+    """
+
+    def __init__(self, ttl: int = 86400, max_messages: int = 50):
+        self.ttl = ttl
+        # Sliding window: without a cap the history grows (and renders)
+        # without bound over a long session
+        self.max_messages = max_messages
+        self._redis = None
+        redis_url = os.getenv("REDIS_URL")
+        if REDIS_AVAILABLE and redis_url:
+            self._redis = aioredis.Redis.from_url(redis_url)
+        self._memory: Dict[str, Deque[Dict]] = {}
+
+    async def history(self, session_id: str) -> List[Dict]:
+        """Return the full message history for a session"""
+        if self._redis:
+            raw = await self._redis.lrange(f"chat:{session_id}", 0, -1)
+            return [json.loads(item) for item in raw]
+        return list(self._memory.get(session_id, []))
+
+    async def append(self, session_id: str, message: Dict) -> None:
+        """Append a message and refresh the session TTL"""
+        if self._redis:
+            key = f"chat:{session_id}"
+            await self._redis.rpush(key, json.dumps(message))
+            await self._redis.ltrim(key, -self.max_messages, -1)
+            await self._redis.expire(key, self.ttl)
+            return
+        self._memory.setdefault(
+            session_id, deque(maxlen=self.max_messages)
+        ).append(message)
+
+    async def clear(self, session_id: str) -> None:
+        """Drop the history for a session"""
+        if self._redis:
+            await self._redis.delete(f"chat:{session_id}")
+            return
+        self._memory.pop(session_id, None)
+
+
+conversations = ConversationStore()
+
+_TOKEN_RE = re.compile(r"[a-z']+")
+
+
+class SemanticCache:
+    """Similarity cache so re-asked finance questions skip the chatbot call
+
+    Messages are compared as token sets with Jaccard similarity, which
+    catches rewordings like "help me budget" vs "budgeting tips help"
+    without an embedding model.
+    """
+
+    def __init__(self, threshold: float = 0.9, maxsize: int = 256, ttl: float = 3600.0):
+        self.threshold = threshold
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: Dict[str, tuple] = {}
+        # Inverted index: token -> keys of entries containing it, so a
+        # lookup only scores entries sharing at least one token instead
+        # of scanning the whole cache
+        self._token_index: Dict[str, set] = {}
+
+    @staticmethod
+    def _tokens(text: str) -> frozenset:
+        return frozenset(_TOKEN_RE.findall(text.casefold()))
+
+    def _evict(self, key: str) -> None:
+        """Drop an entry and unindex its tokens"""
+        cached_tokens, _, _ = self._entries.pop(key)
+        for token in cached_tokens:
+            keys = self._token_index.get(token)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._token_index[token]
+
+    def get(self, message: str) -> str:
+        """Return a cached response for a similar-enough message, or None"""
+        now = time.monotonic()
+        tokens = self._tokens(message)
+
+        candidates = set()
+        for token in tokens:
+            candidates |= self._token_index.get(token, frozenset())
+
+        best_response = None
+        best_similarity = self.threshold
+        for key in candidates:
+            cached_tokens, response, expires_at = self._entries[key]
+            if now > expires_at:
+                self._evict(key)
+                continue
+            similarity = len(tokens & cached_tokens) / len(tokens | cached_tokens)
+            if similarity >= best_similarity:
+                best_response, best_similarity = response, similarity
+
+        if best_response is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return best_response
+
+    def set(self, message: str, response: str) -> None:
+        """Cache a response, evicting the oldest entry when full"""
+        key = message.casefold().strip()
+        if key in self._entries:
+            self._evict(key)
+        elif len(self._entries) >= self.maxsize:
+            self._evict(next(iter(self._entries)))
+
+        entry_tokens = self._tokens(message)
+        self._entries[key] = (entry_tokens, response, time.monotonic() + self.ttl)
+        for token in entry_tokens:
+            self._token_index.setdefault(token, set()).add(key)
+
 
-templates = Jinja2Templates(directory=templates_dir)
+response_cache = SemanticCache()
 
-# Initialize chatbot
-if BACKEND_AVAILABLE:
-    chatbot = PersonalFinanceChatbot()
-else:
-    chatbot = None
 
-# In-memory conversation storage (use database in production)
-conversations: Dict[str, List[Dict]] = {}
+# Timestamps have one-second resolution, so the formatted string is
+# memoized per second instead of building a datetime + strftime per message
+_last_timestamp = (0, "")
+
+
+def _format_timestamp() -> str:
+    """Return the current HH:MM:SS, reusing the string within a second"""
+    global _last_timestamp
+    now = int(time.time())
+    if now != _last_timestamp[0]:
+        local = time.localtime(now)
+        _last_timestamp = (
+            now,
+            f"{local.tm_hour:02d}:{local.tm_min:02d}:{local.tm_sec:02d}",
+        )
+    return _last_timestamp[1]
 
 
 class ChatMessage:
     def __init__(self, sender: str, message: str, timestamp: str = None):
         self.sender = sender
         self.message = message
-        self.timestamp = timestamp or datetime.datetime.now().strftime("%H:%M:%S")
+        self.timestamp = timestamp or _format_timestamp()
         
     def to_dict(self):
         return {
@@ -58,73 +285,117 @@ class ChatMessage:
         }
 
 
-def get_demo_response(message: str) -> str:
-    """Generate demo responses when backend isn't available"""
-    message_lower = message.lower()
-    
-    if any(word in message_lower for word in ['budget', 'budgeting']):
-        return ("Creating a budget is essential for financial health! Here's a simple approach:\n\n"
+# The greeting never changes, so the string and its message dict are
+# interned once at import instead of rebuilt for every new session
+_WELCOME = ("Hello! 👋 I'm your Personal Finance Assistant. I can help you with "
+            "budgeting, investing, debt management, and more! What would you "
+            "like to discuss today?")
+_WELCOME_MESSAGE = ChatMessage("Assistant", _WELCOME).to_dict()
+
+
+# One precompiled row string renders the message list with str.format +
+# str.join instead of Jinja's per-field bytecode dispatch
+_ROW = ('<div class="message {cls}">'
+        '<div class="message-header">'
+        '<span class="sender">{sender}</span>'
+        '<span class="timestamp">{timestamp}</span>'
+        '</div>'
+        '<div class="message-content">{message}</div>'
+        '</div>')
+
+
+def _render_messages(messages: List[Dict]) -> str:
+    """Render the chat history to HTML outside of Jinja
+
+    Fields are escaped here rather than stored escaped, because the
+    WebSocket path sends the same dicts to the browser as raw text.
+    """
+    return "".join(
+        _ROW.format(
+            cls=escape(m["sender"]).lower(),
+            sender=escape(m["sender"]),
+            timestamp=escape(m["timestamp"]),
+            message=escape(m["message"]),
+        )
+        for m in messages
+    )
+
+
+# Demo responses built once at import; dispatch happens through a single
+# word-boundary regex pass instead of repeated substring scans
+_DEMO_RESPONSES = {
+    'budget': ("Creating a budget is essential for financial health! Here's a simple approach:\n\n"
                "• Track your income and expenses for a month\n"
                "• Use the 50/30/20 rule: 50% needs, 30% wants, 20% savings\n"
                "• Start with essential categories: housing, food, transportation\n"
                "• Set realistic savings goals\n\n"
-               "Would you like help with any specific budgeting category?")
-               
-    elif any(word in message_lower for word in ['invest', 'investment']):
-        return ("Great question about investing! For beginners, consider:\n\n"
+               "Would you like help with any specific budgeting category?"),
+    'invest': ("Great question about investing! For beginners, consider:\n\n"
                "• Start with an emergency fund (3-6 months expenses)\n"
                "• Consider low-cost index funds or ETFs\n"
                "• Take advantage of employer 401(k) matching\n"
                "• Diversify your portfolio\n"
                "• Think long-term and don't panic during market dips\n\n"
-               "Remember: invest only what you can afford to lose!")
-               
-    elif any(word in message_lower for word in ['debt', 'loan']):
-        return ("Managing debt effectively is crucial! Here's my advice:\n\n"
-               "• List all debts with balances and interest rates\n"
-               "• Pay minimums on all debts\n"
-               "• Use debt avalanche (highest interest first) or snowball (smallest balance first)\n"
-               "• Consider debt consolidation if it lowers rates\n"
-               "• Avoid taking on new debt while paying off existing debt\n\n"
-               "Would you like help prioritizing your specific debts?")
-               
-    elif any(word in message_lower for word in ['save', 'saving']):
-        return ("Smart saving strategies can accelerate your financial goals:\n\n"
-               "• Automate savings - pay yourself first\n"
-               "• Use high-yield savings accounts\n"
-               "• Set specific, measurable savings goals\n"
-               "• Track your progress regularly\n"
-               "• Consider the 52-week savings challenge\n\n"
-               "What are you saving for? I can help you create a plan!")
-               
-    else:
-        return ("Thanks for your question! I can help with:\n\n"
-               "💰 Budgeting and expense tracking\n"
-               "📈 Investment strategies and portfolio advice\n"
-               "💳 Debt management and payoff strategies\n"
-               "🏠 Saving for major purchases\n"
-               "📊 Financial planning and goal setting\n\n"
-               "What specific financial topic would you like to explore?")
+               "Remember: invest only what you can afford to lose!"),
+    'debt': ("Managing debt effectively is crucial! Here's my advice:\n\n"
+             "• List all debts with balances and interest rates\n"
+             "• Pay minimums on all debts\n"
+             "• Use debt avalanche (highest interest first) or snowball (smallest balance first)\n"
+             "• Consider debt consolidation if it lowers rates\n"
+             "• Avoid taking on new debt while paying off existing debt\n\n"
+             "Would you like help prioritizing your specific debts?"),
+    'save': ("Smart saving strategies can accelerate your financial goals:\n\n"
+             "• Automate savings - pay yourself first\n"
+             "• Use high-yield savings accounts\n"
+             "• Set specific, measurable savings goals\n"
+             "• Track your progress regularly\n"
+             "• Consider the 52-week savings challenge\n\n"
+             "What are you saving for? I can help you create a plan!"),
+}
+
+_DEFAULT_RESPONSE = ("Thanks for your question! I can help with:\n\n"
+                     "💰 Budgeting and expense tracking\n"
+                     "📈 Investment strategies and portfolio advice\n"
+                     "💳 Debt management and payoff strategies\n"
+                     "🏠 Saving for major purchases\n"
+                     "📊 Financial planning and goal setting\n\n"
+                     "What specific financial topic would you like to explore?")
+
+# Keywords per topic as pre-lowered frozensets: the message is tokenized
+# once and each topic check is a C-level set intersection with real word
+# boundaries ("budgetary" no longer matches "budget")
+_TOPIC_KEYWORDS = (
+    ('budget', frozenset({'budget', 'budgeting'})),
+    ('invest', frozenset({'invest', 'investment'})),
+    ('debt', frozenset({'debt', 'loan'})),
+    ('save', frozenset({'save', 'saving'})),
+)
+
+
+def get_demo_response(message: str) -> str:
+    """Generate demo responses when backend isn't available"""
+    tokens = frozenset(_TOKEN_RE.findall(message.casefold()))
+    for topic, keywords in _TOPIC_KEYWORDS:
+        if tokens & keywords:
+            return _DEMO_RESPONSES[topic]
+    return _DEFAULT_RESPONSE
 
 
 @app.get("/", response_class=HTMLResponse)
 async def home(request: Request):
     """Home page with chat interface"""
     session_id = "default"  # In production, use proper session management
-    
+
     # Initialize conversation if doesn't exist
-    if session_id not in conversations:
-        conversations[session_id] = []
-        # Add welcome message
-        welcome_msg = ChatMessage(
-            "Assistant", 
-            "Hello! 👋 I'm your Personal Finance Assistant. I can help you with budgeting, investing, debt management, and more! What would you like to discuss today?"
-        )
-        conversations[session_id].append(welcome_msg.to_dict())
-    
+    messages = await conversations.history(session_id)
+    if not messages:
+        # Add the interned welcome message
+        await conversations.append(session_id, _WELCOME_MESSAGE)
+        messages = [_WELCOME_MESSAGE]
+
     return templates.TemplateResponse("chat.html", {
         "request": request,
-        "messages": conversations[session_id],
+        "rendered_rows": _render_messages(messages),
         "backend_available": BACKEND_AVAILABLE
     })
 
@@ -133,58 +404,316 @@ async def home(request: Request):
 async def chat(request: Request, message: str = Form(...)):
     """Handle chat messages"""
     session_id = "default"  # In production, use proper session management
-    
-    if session_id not in conversations:
-        conversations[session_id] = []
-    
+
     # Add user message
     user_msg = ChatMessage("You", message)
-    conversations[session_id].append(user_msg.to_dict())
-    
+    await conversations.append(session_id, user_msg.to_dict())
+
     # Generate response
-    try:
-        if chatbot and BACKEND_AVAILABLE:
-            response = chatbot.get_response(message)
-        else:
-            response = get_demo_response(message)
-    except Exception as e:
-        response = f"Sorry, I encountered an error: {str(e)}\nPlease try again or check your API configuration."
-    
+    response = await generate_response(message)
+
     # Add assistant response
     assistant_msg = ChatMessage("Assistant", response)
-    conversations[session_id].append(assistant_msg.to_dict())
-    
+    await conversations.append(session_id, assistant_msg.to_dict())
+
     return RedirectResponse(url="/", status_code=303)
 
 
-@app.get("/api/status")
-async def api_status():
-    """Get API status"""
+@app.websocket("/ws")
+async def websocket_chat(ws: WebSocket):
+    """Stream chat turns over a persistent connection
+
+    Avoids the POST-redirect-GET cycle and the full template re-render
+    per message; the browser appends each JSON frame to the DOM.
+    """
+    await ws.accept()
+    session_id = "default"
+
+    try:
+        while True:
+            message = (await ws.receive_text()).strip()
+            if not message:
+                continue
+
+            user_msg = ChatMessage("You", message)
+            await conversations.append(session_id, user_msg.to_dict())
+            await ws.send_json(user_msg.to_dict())
+
+            response = await generate_response(message)
+            assistant_msg = ChatMessage("Assistant", response)
+            await conversations.append(session_id, assistant_msg.to_dict())
+            await ws.send_json(assistant_msg.to_dict())
+    except WebSocketDisconnect:
+        pass
+
+
+async def generate_response(message: str) -> str:
+    """Produce a reply, trying the semantic cache before the chatbot"""
+    try:
+        response = response_cache.get(message)
+        if response is None:
+            chatbot = get_chatbot()
+            if chatbot is not None:
+                # Run the blocking chatbot call off the event loop
+                response = await asyncio.to_thread(chatbot.get_response, message)
+            else:
+                response = get_demo_response(message)
+            response_cache.set(message, response)
+        return response
+    except Exception as e:
+        return f"Sorry, I encountered an error: {str(e)}\nPlease try again or check your API configuration."
+
+
+@functools.lru_cache(maxsize=1)
+def _backend_status() -> Dict:
+    """Availability flags reflect startup-time state and never change"""
     status = {
         "backend_available": BACKEND_AVAILABLE,
         "openai_available": False,
-        "google_nlu_available": False
+        "google_nlu_available": False,
     }
-    
-    if chatbot and BACKEND_AVAILABLE:
+    chatbot = get_chatbot()
+    if chatbot is not None:
         try:
-            status["openai_available"] = hasattr(chatbot, 'openai_client') and chatbot.openai_client is not None
-            status["google_nlu_available"] = hasattr(chatbot, 'nlu_client') and chatbot.nlu_client is not None
+            status["openai_available"] = getattr(chatbot, 'openai_client', None) is not None
+            status["google_nlu_available"] = getattr(chatbot, 'nlu_client', None) is not None
         except:
             pass
-    
     return status
 
 
+@app.get("/api/status")
+async def api_status():
+    """Get API status"""
+    # Only the cache counters change after startup
+    return {
+        **_backend_status(),
+        "cache_hits": response_cache.hits,
+        "cache_misses": response_cache.misses,
+    }
+
+
 @app.get("/clear")
 async def clear_chat():
     """Clear chat history"""
     session_id = "default"
-    if session_id in conversations:
-        conversations[session_id] = []
+    await conversations.clear(session_id)
     return RedirectResponse(url="/", status_code=303)
 
 
+_CHAT_CSS = '''* {
+    margin: 0;
+    padding: 0;
+    box-sizing: border-box;
+}
+
+body {
+    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    min-height: 100vh;
+    display: flex;
+    flex-direction: column;
+}
+
+.header {
+    background: rgba(255, 255, 255, 0.95);
+    backdrop-filter: blur(10px);
+    padding: 1rem 2rem;
+    box-shadow: 0 2px 20px rgba(0, 0, 0, 0.1);
+    display: flex;
+    justify-content: space-between;
+    align-items: center;
+}
+
+.header h1 {
+    color: #333;
+    font-size: 1.5rem;
+    font-weight: 600;
+}
+
+.status {
+    display: flex;
+    gap: 1rem;
+    font-size: 0.9rem;
+    color: #666;
+}
+
+.container {
+    flex: 1;
+    display: flex;
+    flex-direction: column;
+    max-width: 800px;
+    margin: 2rem auto;
+    padding: 0 1rem;
+    width: 100%;
+}
+
+.chat-container {
+    background: white;
+    border-radius: 15px;
+    box-shadow: 0 10px 40px rgba(0, 0, 0, 0.1);
+    flex: 1;
+    display: flex;
+    flex-direction: column;
+    min-height: 500px;
+}
+
+.chat-messages {
+    flex: 1;
+    padding: 2rem;
+    overflow-y: auto;
+    max-height: 400px;
+}
+
+.message {
+    margin-bottom: 1.5rem;
+    animation: fadeIn 0.3s ease-in;
+}
+
+@keyframes fadeIn {
+    from { opacity: 0; transform: translateY(10px); }
+    to { opacity: 1; transform: translateY(0); }
+}
+
+.message-header {
+    display: flex;
+    align-items: center;
+    gap: 0.5rem;
+    margin-bottom: 0.5rem;
+}
+
+.sender {
+    font-weight: 600;
+    color: #333;
+}
+
+.timestamp {
+    font-size: 0.8rem;
+    color: #888;
+}
+
+.message-content {
+    background: #f8f9fa;
+    padding: 1rem;
+    border-radius: 10px;
+    line-height: 1.5;
+    white-space: pre-line;
+}
+
+.message.assistant .message-content {
+    background: linear-gradient(135deg, #e3f2fd 0%, #f0f8ff 100%);
+    border-left: 4px solid #2196f3;
+}
+
+.message.user .message-content {
+    background: linear-gradient(135deg, #e8f5e8 0%, #f0fff0 100%);
+    border-left: 4px solid #4caf50;
+}
+
+.input-section {
+    padding: 1.5rem;
+    border-top: 1px solid #eee;
+}
+
+.quick-actions {
+    display: flex;
+    gap: 0.5rem;
+    margin-bottom: 1rem;
+    flex-wrap: wrap;
+}
+
+.quick-btn {
+    background: #e3f2fd;
+    border: none;
+    padding: 0.5rem 1rem;
+    border-radius: 20px;
+    color: #1976d2;
+    cursor: pointer;
+    font-size: 0.9rem;
+    transition: all 0.2s ease;
+}
+
+.quick-btn:hover {
+    background: #2196f3;
+    color: white;
+    transform: translateY(-2px);
+}
+
+.input-form {
+    display: flex;
+    gap: 1rem;
+}
+
+.message-input {
+    flex: 1;
+    padding: 1rem;
+    border: 2px solid #e0e0e0;
+    border-radius: 25px;
+    font-size: 1rem;
+    outline: none;
+    transition: border-color 0.2s ease;
+}
+
+.message-input:focus {
+    border-color: #2196f3;
+}
+
+.send-btn {
+    background: linear-gradient(135deg, #2196f3 0%, #21cbf3 100%);
+    color: white;
+    border: none;
+    padding: 1rem 2rem;
+    border-radius: 25px;
+    font-weight: 600;
+    cursor: pointer;
+    transition: all 0.2s ease;
+}
+
+.send-btn:hover {
+    transform: translateY(-2px);
+    box-shadow: 0 5px 15px rgba(33, 150, 243, 0.3);
+}
+
+.actions {
+    display: flex;
+    gap: 1rem;
+    justify-content: center;
+    margin-top: 1rem;
+}
+
+.action-btn {
+    background: rgba(255, 255, 255, 0.9);
+    color: #333;
+    border: none;
+    padding: 0.5rem 1rem;
+    border-radius: 8px;
+    cursor: pointer;
+    text-decoration: none;
+    transition: all 0.2s ease;
+}
+
+.action-btn:hover {
+    background: white;
+    transform: translateY(-1px);
+}
+
+@media (max-width: 600px) {
+    .container {
+        margin: 1rem auto;
+        padding: 0 0.5rem;
+    }
+    
+    .input-form {
+        flex-direction: column;
+    }
+    
+    .quick-actions {
+        flex-direction: column;
+    }
+}
+'''
+
+
 def create_chat_template():
     """Create the HTML template for the chat interface"""
     template_content = '''<!DOCTYPE html>
@@ -193,218 +722,7 @@ def create_chat_template():
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>💰 Personal Finance Chatbot</title>
-    <style>
-        * {
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }
-
-        body {
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            min-height: 100vh;
-            display: flex;
-            flex-direction: column;
-        }
-
-        .header {
-            background: rgba(255, 255, 255, 0.95);
-            backdrop-filter: blur(10px);
-            padding: 1rem 2rem;
-            box-shadow: 0 2px 20px rgba(0, 0, 0, 0.1);
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-        }
-
-        .header h1 {
-            color: #333;
-            font-size: 1.5rem;
-            font-weight: 600;
-        }
-
-        .status {
-            display: flex;
-            gap: 1rem;
-            font-size: 0.9rem;
-            color: #666;
-        }
-
-        .container {
-            flex: 1;
-            display: flex;
-            flex-direction: column;
-            max-width: 800px;
-            margin: 2rem auto;
-            padding: 0 1rem;
-            width: 100%;
-        }
-
-        .chat-container {
-            background: white;
-            border-radius: 15px;
-            box-shadow: 0 10px 40px rgba(0, 0, 0, 0.1);
-            flex: 1;
-            display: flex;
-            flex-direction: column;
-            min-height: 500px;
-        }
-
-        .chat-messages {
-            flex: 1;
-            padding: 2rem;
-            overflow-y: auto;
-            max-height: 400px;
-        }
-
-        .message {
-            margin-bottom: 1.5rem;
-            animation: fadeIn 0.3s ease-in;
-        }
-
-        @keyframes fadeIn {
-            from { opacity: 0; transform: translateY(10px); }
-            to { opacity: 1; transform: translateY(0); }
-        }
-
-        .message-header {
-            display: flex;
-            align-items: center;
-            gap: 0.5rem;
-            margin-bottom: 0.5rem;
-        }
-
-        .sender {
-            font-weight: 600;
-            color: #333;
-        }
-
-        .timestamp {
-            font-size: 0.8rem;
-            color: #888;
-        }
-
-        .message-content {
-            background: #f8f9fa;
-            padding: 1rem;
-            border-radius: 10px;
-            line-height: 1.5;
-            white-space: pre-line;
-        }
-
-        .message.assistant .message-content {
-            background: linear-gradient(135deg, #e3f2fd 0%, #f0f8ff 100%);
-            border-left: 4px solid #2196f3;
-        }
-
-        .message.user .message-content {
-            background: linear-gradient(135deg, #e8f5e8 0%, #f0fff0 100%);
-            border-left: 4px solid #4caf50;
-        }
-
-        .input-section {
-            padding: 1.5rem;
-            border-top: 1px solid #eee;
-        }
-
-        .quick-actions {
-            display: flex;
-            gap: 0.5rem;
-            margin-bottom: 1rem;
-            flex-wrap: wrap;
-        }
-
-        .quick-btn {
-            background: #e3f2fd;
-            border: none;
-            padding: 0.5rem 1rem;
-            border-radius: 20px;
-            color: #1976d2;
-            cursor: pointer;
-            font-size: 0.9rem;
-            transition: all 0.2s ease;
-        }
-
-        .quick-btn:hover {
-            background: #2196f3;
-            color: white;
-            transform: translateY(-2px);
-        }
-
-        .input-form {
-            display: flex;
-            gap: 1rem;
-        }
-
-        .message-input {
-            flex: 1;
-            padding: 1rem;
-            border: 2px solid #e0e0e0;
-            border-radius: 25px;
-            font-size: 1rem;
-            outline: none;
-            transition: border-color 0.2s ease;
-        }
-
-        .message-input:focus {
-            border-color: #2196f3;
-        }
-
-        .send-btn {
-            background: linear-gradient(135deg, #2196f3 0%, #21cbf3 100%);
-            color: white;
-            border: none;
-            padding: 1rem 2rem;
-            border-radius: 25px;
-            font-weight: 600;
-            cursor: pointer;
-            transition: all 0.2s ease;
-        }
-
-        .send-btn:hover {
-            transform: translateY(-2px);
-            box-shadow: 0 5px 15px rgba(33, 150, 243, 0.3);
-        }
-
-        .actions {
-            display: flex;
-            gap: 1rem;
-            justify-content: center;
-            margin-top: 1rem;
-        }
-
-        .action-btn {
-            background: rgba(255, 255, 255, 0.9);
-            color: #333;
-            border: none;
-            padding: 0.5rem 1rem;
-            border-radius: 8px;
-            cursor: pointer;
-            text-decoration: none;
-            transition: all 0.2s ease;
-        }
-
-        .action-btn:hover {
-            background: white;
-            transform: translateY(-1px);
-        }
-
-        @media (max-width: 600px) {
-            .container {
-                margin: 1rem auto;
-                padding: 0 0.5rem;
-            }
-            
-            .input-form {
-                flex-direction: column;
-            }
-            
-            .quick-actions {
-                flex-direction: column;
-            }
-        }
-    </style>
+    <link rel="stylesheet" href="/static/chat.css">
 </head>
 <body>
     <div class="header">
@@ -421,15 +739,7 @@ def create_chat_template():
     <div class="container">
         <div class="chat-container">
             <div class="chat-messages">
-                {% for message in messages %}
-                <div class="message {{ message.sender.lower() }}">
-                    <div class="message-header">
-                        <span class="sender">{{ message.sender }}</span>
-                        <span class="timestamp">{{ message.timestamp }}</span>
-                    </div>
-                    <div class="message-content">{{ message.message }}</div>
-                </div>
-                {% endfor %}
+                {{ rendered_rows | safe }}
             </div>
 
             <div class="input-section">
@@ -461,41 +771,140 @@ def create_chat_template():
     </div>
 
     <script>
+        const chatMessages = document.querySelector('.chat-messages');
+        const inputForm = document.querySelector('.input-form');
+        const messageInput = document.querySelector('.message-input');
+
+        // Stream turns over a WebSocket when possible; the form POST
+        // stays as a no-JS / no-WS fallback
+        let socket = null;
+        try {
+            const wsScheme = location.protocol === 'https:' ? 'wss://' : 'ws://';
+            socket = new WebSocket(wsScheme + location.host + '/ws');
+        } catch (err) {
+            socket = null;
+        }
+
+        function appendMessage(msg) {
+            const wrapper = document.createElement('div');
+            wrapper.className = 'message ' + msg.sender.toLowerCase();
+
+            const header = document.createElement('div');
+            header.className = 'message-header';
+            const sender = document.createElement('span');
+            sender.className = 'sender';
+            sender.textContent = msg.sender;
+            const timestamp = document.createElement('span');
+            timestamp.className = 'timestamp';
+            timestamp.textContent = msg.timestamp;
+            header.appendChild(sender);
+            header.appendChild(timestamp);
+
+            const content = document.createElement('div');
+            content.className = 'message-content';
+            content.textContent = msg.message;
+
+            wrapper.appendChild(header);
+            wrapper.appendChild(content);
+            chatMessages.appendChild(wrapper);
+            chatMessages.scrollTop = chatMessages.scrollHeight;
+        }
+
+        if (socket) {
+            socket.onmessage = (event) => appendMessage(JSON.parse(event.data));
+        }
+
+        inputForm.addEventListener('submit', (event) => {
+            if (socket && socket.readyState === WebSocket.OPEN) {
+                event.preventDefault();
+                const message = messageInput.value.trim();
+                if (message) {
+                    socket.send(message);
+                    messageInput.value = '';
+                }
+            }
+        });
+
         function sendQuickMessage(message) {
-            const input = document.querySelector('.message-input');
-            input.value = message;
-            document.querySelector('.input-form').submit();
+            if (socket && socket.readyState === WebSocket.OPEN) {
+                socket.send(message);
+                return;
+            }
+            messageInput.value = message;
+            inputForm.submit();
         }
 
         // Auto-scroll to bottom
-        const chatMessages = document.querySelector('.chat-messages');
         chatMessages.scrollTop = chatMessages.scrollHeight;
 
         // Focus on input
-        document.querySelector('.message-input').focus();
+        messageInput.focus();
     </script>
 </body>
 </html>'''
     
-    template_path = os.path.join(templates_dir, "chat.html")
-    with open(template_path, "w", encoding="utf-8") as f:
-        f.write(template_content)
+    _write_if_changed(os.path.join(templates_dir, "chat.html"), template_content)
+
+    # The stylesheet is served by StaticFiles with a long max-age, so
+    # repeat visits only fetch the (much smaller) HTML shell
+    _write_if_changed(os.path.join(static_dir, "chat.css"), _CHAT_CSS)
+
+
+def _write_if_changed(path: str, content: str) -> None:
+    """Write a generated file only when its content actually changed
+
+    A sibling `.hash` file records the digest of the last write, so
+    process restarts skip the disk write (and keep the Jinja bytecode
+    cache and StaticFiles ETags valid) when nothing changed.
+    """
+    encoded = content.encode("utf-8")
+    digest = hashlib.blake2b(encoded).hexdigest()
+    hash_path = path + ".hash"
+
+    if os.path.exists(path):
+        try:
+            with open(hash_path, "r", encoding="utf-8") as f:
+                if f.read() == digest:
+                    return
+        except OSError:
+            pass
+
+    with open(path, "wb") as f:
+        f.write(encoded)
+    with open(hash_path, "w", encoding="utf-8") as f:
+        f.write(digest)
 
 
 def main():
     """Run the FastAPI application"""
     # Create template file
     create_chat_template()
-    
+
+    # Warm the compiled template so the first request doesn't parse it
+    templates.env.get_template("chat.html")
+
     print("🚀 Starting Personal Finance Chatbot - FastAPI Frontend")
     print(f"📁 Templates directory: {templates_dir}")
     print(f"🔧 Backend available: {BACKEND_AVAILABLE}")
     
+    # Import string (not the app object) so uvicorn can fork workers;
+    # uvloop + httptools replace the default loop and HTTP parser, and
+    # warning-level logging skips per-request access-log formatting.
+    # The module name differs when run as a script vs imported from the
+    # launcher, so resolve it from the import spec.
+    # Default to a single worker: without a Redis backend the
+    # ConversationStore is per-process memory, and multiple workers
+    # would each see a different history. WEB_CONCURRENCY opts in to
+    # more workers on deployments with shared storage.
+    module = __spec__.name if __spec__ is not None else "fastapi_frontend"
     uvicorn.run(
-        app, 
-        host="0.0.0.0", 
+        f"{module}:app",
+        host="0.0.0.0",
         port=8000,
-        log_level="info"
+        workers=int(os.getenv("WEB_CONCURRENCY", "1")),
+        loop="uvloop",
+        http="httptools",
+        log_level="warning",
     )
 
 
@@ -6,11 +6,13 @@ Modern mobile-like interface using Kivy for cross-platform deployment
 try:
     from kivy.app import App
     from kivy.uix.boxlayout import BoxLayout
-    from kivy.uix.scrollview import ScrollView
     from kivy.uix.label import Label
     from kivy.uix.textinput import TextInput
     from kivy.uix.button import Button
     from kivy.uix.gridlayout import GridLayout
+    from kivy.uix.recycleboxlayout import RecycleBoxLayout
+    from kivy.uix.recycleview import RecycleView
+    from kivy.uix.recycleview.views import RecycleDataViewBehavior
     from kivy.uix.screenmanager import ScreenManager, Screen
     from kivy.clock import Clock
     from kivy.metrics import dp
@@ -21,90 +23,158 @@ except ImportError:
     KIVY_AVAILABLE = False
     print("Kivy not installed. Install with: pip install kivy")
 
+import re
 import sys
 import os
+import queue
+import textwrap
 import threading
 import datetime
 
-# Add backend to Python path
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'backend'))
+# Make the project root importable so `backend` resolves as a package
+# and every frontend shares one canonical module instance; appending the
+# backend directory itself re-parsed its modules under different names
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
 
 try:
-    from main import PersonalFinanceChatbot
-    from utils import extract_amounts, format_currency
+    from backend.main import PersonalFinanceChatbot
+    from backend.utils import extract_amounts, format_currency
     BACKEND_AVAILABLE = True
 except ImportError:
     BACKEND_AVAILABLE = False
     print("Backend modules not available, running in demo mode")
 
 
-class MessageBubble(BoxLayout):
-    """Custom widget for chat message bubbles"""
-    
-    def __init__(self, sender, message, timestamp=None, **kwargs):
+# Demo responses built once at import; dispatch happens through a single
+# word-boundary regex pass instead of repeated substring scans
+_DEMO_RESPONSES = {
+    'budget': ("Creating a budget is essential! Here's a simple approach:\n\n"
+               "1. Track income and expenses\n"
+               "2. Use 50/30/20 rule\n"
+               "3. Start with essentials\n"
+               "4. Set realistic goals\n\n"
+               "Need help with a specific category?"),
+    'invest': ("Great investing question! For beginners:\n\n"
+               "1. Build emergency fund first\n"
+               "2. Consider index funds\n"
+               "3. Use 401(k) matching\n"
+               "4. Diversify portfolio\n"
+               "5. Think long-term\n\n"
+               "Want specific investment advice?"),
+    'debt': ("Debt management strategies:\n\n"
+             "1. List all debts\n"
+             "2. Pay minimums first\n"
+             "3. Use avalanche/snowball method\n"
+             "4. Avoid new debt\n\n"
+             "Need help prioritizing debts?"),
+}
+
+# The greeting never changes; build it once at import
+_WELCOME = ("Hello! 👋 I'm your Personal Finance Assistant.\n\n"
+            "I can help you with:\n"
+            "• Budgeting and expense tracking\n"
+            "• Investment strategies\n"
+            "• Debt management\n"
+            "• Saving for goals\n\n"
+            "What would you like to discuss today?")
+
+_DEFAULT_RESPONSE = ("I'm here to help with your finances!\n\n"
+                     "Try asking about:\n"
+                     "💰 Budgeting tips\n"
+                     "📈 Investment advice\n"
+                     "💳 Debt strategies\n"
+                     "🏠 Saving goals\n\n"
+                     "What's your main financial concern?")
+
+# Keywords per topic as pre-lowered frozensets: the message is tokenized
+# once and each topic check is a C-level set intersection with real word
+# boundaries ("budgetary" no longer matches "budget")
+_TOPIC_KEYWORDS = (
+    ('budget', frozenset({'budget', 'budgeting'})),
+    ('invest', frozenset({'invest', 'investment'})),
+    ('debt', frozenset({'debt', 'loan'})),
+)
+
+_TOKEN_RE = re.compile(r"[a-z']+")
+
+
+def _measure_message_height(message):
+    """Estimate the bubble height for a message from font metrics
+
+    Wrapped line counts come from textwrap against the known wrap width,
+    so no off-screen texture is rendered per message.
+    """
+    wrap_width = max(1, int((Window.width - dp(40)) / dp(7)))
+    lines = 0
+    for paragraph in message.split('\n'):
+        lines += max(1, len(textwrap.wrap(paragraph, width=wrap_width)))
+    # line height + header row + spacing + vertical padding
+    return lines * dp(20) + dp(35)
+
+
+class MessageBubbleView(RecycleDataViewBehavior, BoxLayout):
+    """Recycled chat bubble; a handful of instances serve the whole history"""
+
+    def __init__(self, **kwargs):
         super().__init__(orientation='vertical', size_hint_y=None, **kwargs)
         self.spacing = dp(5)
         self.padding = [dp(10), dp(5)]
-        
-        # Set height based on content
-        self.bind(minimum_height=self.setter('height'))
-        
+
         # Header with sender and timestamp
         header = BoxLayout(size_hint_y=None, height=dp(20))
-        sender_label = Label(
-            text=sender,
+        self.sender_label = Label(
+            text='',
             font_size=dp(12),
             bold=True,
             size_hint_y=None,
             height=dp(20),
-            text_size=(None, None),
             halign='left'
         )
-        
-        if not timestamp:
-            timestamp = datetime.datetime.now().strftime("%H:%M")
-        
-        time_label = Label(
-            text=timestamp,
+        self.time_label = Label(
+            text='',
             font_size=dp(10),
             color=(0.7, 0.7, 0.7, 1),
             size_hint_y=None,
             height=dp(20),
-            text_size=(None, None),
             halign='right'
         )
-        
-        header.add_widget(sender_label)
-        header.add_widget(time_label)
+        header.add_widget(self.sender_label)
+        header.add_widget(self.time_label)
         self.add_widget(header)
-        
+
         # Message content
-        message_label = Label(
-            text=message,
+        self.message_label = Label(
+            text='',
             font_size=dp(14),
-            text_size=(Window.width - dp(40), None),
             halign='left',
             valign='top',
             size_hint_y=None
         )
-        message_label.bind(texture_size=message_label.setter('size'))
-        
-        # Style based on sender
-        with message_label.canvas.before:
-            if sender == "You":
-                Color(0.85, 0.95, 0.85, 1)  # Light green for user
-            else:
-                Color(0.9, 0.95, 1, 1)  # Light blue for assistant
-            
+        with self.message_label.canvas.before:
+            self.bg_color = Color(0.9, 0.95, 1, 1)
             self.rect = RoundedRectangle(
-                pos=message_label.pos,
-                size=message_label.size,
+                pos=self.message_label.pos,
+                size=self.message_label.size,
                 radius=[dp(10)]
             )
-            
-        message_label.bind(pos=self.update_rect, size=self.update_rect)
-        self.add_widget(message_label)
-        
+        self.message_label.bind(pos=self.update_rect, size=self.update_rect)
+        self.add_widget(self.message_label)
+
+    def refresh_view_attrs(self, rv, index, data):
+        """Fill this recycled bubble with the message at `index`"""
+        self.sender_label.text = data['sender']
+        self.time_label.text = data['timestamp']
+        self.message_label.text = data['message']
+        self.message_label.text_size = (Window.width - dp(40), None)
+        self.message_label.height = data['height'] - dp(35)
+        if data['sender'] == "You":
+            self.bg_color.rgba = (0.85, 0.95, 0.85, 1)  # Light green for user
+        else:
+            self.bg_color.rgba = (0.9, 0.95, 1, 1)  # Light blue for assistant
+        return super().refresh_view_attrs(rv, index, data)
+
     def update_rect(self, instance, value):
         self.rect.pos = instance.pos
         self.rect.size = instance.size
@@ -122,6 +192,12 @@ class ChatScreen(Screen):
             except Exception as e:
                 print(f"Failed to initialize chatbot: {e}")
         
+        # One long-lived worker consumes messages from a bounded queue;
+        # spawning a thread per message cost ~1ms and let rapid sends
+        # pile up unbounded threads against the UI thread
+        self._request_queue = queue.Queue(maxsize=8)
+        threading.Thread(target=self._response_worker, daemon=True).start()
+
         self.setup_ui()
         self.add_welcome_message()
         
@@ -158,13 +234,19 @@ class ChatScreen(Screen):
         header.add_widget(self.status_label)
         main_layout.add_widget(header)
         
-        # Chat messages area
-        self.scroll = ScrollView()
-        self.chat_layout = GridLayout(cols=1, size_hint_y=None, spacing=dp(5))
-        self.chat_layout.bind(minimum_height=self.chat_layout.setter('height'))
-        
-        self.scroll.add_widget(self.chat_layout)
-        main_layout.add_widget(self.scroll)
+        # Chat messages area: a RecycleView keeps a small pool of bubble
+        # widgets alive no matter how long the conversation gets
+        self.rv = RecycleView()
+        self.rv.viewclass = MessageBubbleView
+        rv_layout = RecycleBoxLayout(
+            orientation='vertical',
+            default_size_hint=(1, None),
+            size_hint_y=None,
+            spacing=dp(5)
+        )
+        rv_layout.bind(minimum_height=rv_layout.setter('height'))
+        self.rv.add_widget(rv_layout)
+        main_layout.add_widget(self.rv)
         
         # Quick action buttons
         quick_layout = GridLayout(
@@ -227,28 +309,24 @@ class ChatScreen(Screen):
         
     def add_welcome_message(self):
         """Add welcome message to chat"""
-        welcome_text = (
-            "Hello! 👋 I'm your Personal Finance Assistant.\n\n"
-            "I can help you with:\n"
-            "• Budgeting and expense tracking\n"
-            "• Investment strategies\n" 
-            "• Debt management\n"
-            "• Saving for goals\n\n"
-            "What would you like to discuss today?"
-        )
-        self.add_message("Assistant", welcome_text)
+        self.add_message("Assistant", _WELCOME)
         
     def add_message(self, sender, message):
         """Add a message to the chat"""
-        bubble = MessageBubble(sender, message)
-        self.chat_layout.add_widget(bubble)
-        
+        self.rv.data.append({
+            'sender': sender,
+            'message': message,
+            'timestamp': datetime.datetime.now().strftime("%H:%M"),
+            'height': _measure_message_height(message),
+        })
+        self.rv.refresh_from_data()
+
         # Scroll to bottom
         Clock.schedule_once(self.scroll_to_bottom, 0.1)
-        
+
     def scroll_to_bottom(self, dt):
         """Scroll chat to bottom"""
-        self.scroll.scroll_y = 0
+        self.rv.scroll_y = 0
         
     def quick_action(self, action_text):
         """Handle quick action button press"""
@@ -269,81 +347,51 @@ class ChatScreen(Screen):
         
         # Show typing indicator
         self.add_message("Assistant", "Typing...")
-        
-        # Get response in background thread
-        threading.Thread(
-            target=self.get_response_async,
-            args=(user_message,),
-            daemon=True
-        ).start()
-        
-    def get_response_async(self, message):
-        """Get response from chatbot asynchronously"""
+
+        # Hand off to the background worker; if the queue is full the
+        # user is spamming faster than responses arrive, so drop the send
         try:
-            if self.chatbot and BACKEND_AVAILABLE:
-                response = self.chatbot.get_response(message)
-            else:
-                response = self.get_demo_response(message)
-                
-            # Remove typing indicator and add response
-            Clock.schedule_once(
-                lambda dt: self.replace_last_message("Assistant", response),
-                0
+            self._request_queue.put_nowait(user_message)
+        except queue.Full:
+            self.replace_last_message(
+                "Assistant",
+                "I'm still working through your earlier messages — one moment!"
             )
-            
-        except Exception as e:
-            error_msg = f"Sorry, I encountered an error: {str(e)}"
+
+    def _response_worker(self):
+        """Consume queued messages and fetch responses off the UI thread"""
+        while True:
+            message = self._request_queue.get()
+            try:
+                if self.chatbot and BACKEND_AVAILABLE:
+                    response = self.chatbot.get_response(message)
+                else:
+                    response = self.get_demo_response(message)
+            except Exception as e:
+                response = f"Sorry, I encountered an error: {str(e)}"
+
+            # Remove typing indicator and add response
             Clock.schedule_once(
-                lambda dt: self.replace_last_message("Assistant", error_msg),
+                lambda dt, text=response: self.replace_last_message("Assistant", text),
                 0
             )
             
     def replace_last_message(self, sender, message):
         """Replace the last message (used to replace typing indicator)"""
-        if self.chat_layout.children:
+        if self.rv.data:
             # Remove typing indicator
-            self.chat_layout.remove_widget(self.chat_layout.children[0])
-            
+            self.rv.data.pop()
+
         # Add actual response
         self.add_message(sender, message)
         
     def get_demo_response(self, message):
         """Generate demo responses when backend isn't available"""
-        message_lower = message.lower()
-        
-        if any(word in message_lower for word in ['budget', 'budgeting']):
-            return ("Creating a budget is essential! Here's a simple approach:\n\n"
-                   "1. Track income and expenses\n"
-                   "2. Use 50/30/20 rule\n"
-                   "3. Start with essentials\n"
-                   "4. Set realistic goals\n\n"
-                   "Need help with a specific category?")
-                   
-        elif any(word in message_lower for word in ['invest', 'investment']):
-            return ("Great investing question! For beginners:\n\n"
-                   "1. Build emergency fund first\n"
-                   "2. Consider index funds\n"
-                   "3. Use 401(k) matching\n"
-                   "4. Diversify portfolio\n"
-                   "5. Think long-term\n\n"
-                   "Want specific investment advice?")
-                   
-        elif any(word in message_lower for word in ['debt', 'loan']):
-            return ("Debt management strategies:\n\n"
-                   "1. List all debts\n"
-                   "2. Pay minimums first\n"
-                   "3. Use avalanche/snowball method\n"
-                   "4. Avoid new debt\n\n"
-                   "Need help prioritizing debts?")
-                   
-        else:
-            return ("I'm here to help with your finances!\n\n"
-                   "Try asking about:\n"
-                   "💰 Budgeting tips\n"
-                   "📈 Investment advice\n"
-                   "💳 Debt strategies\n"
-                   "🏠 Saving goals\n\n"
-                   "What's your main financial concern?")
+        tokens = frozenset(_TOKEN_RE.findall(message.casefold()))
+        for topic, keywords in _TOPIC_KEYWORDS:
+            if tokens & keywords:
+                return _DEMO_RESPONSES[topic]
+        return _DEFAULT_RESPONSE
 
 
 class FinanceChatbotApp(App):
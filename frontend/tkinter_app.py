@@ -5,42 +5,138 @@ A professional desktop application with modern UI design
 
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox
-import threading
-import queue
+import concurrent.futures
 import datetime
+import re
 import sys
 import os
+import time
 
-# Add backend to Python path
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'backend'))
+# Make the project root importable so `backend` resolves as a package
+# and every frontend shares one canonical module instance; appending the
+# backend directory itself re-parsed its modules under different names
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
 
 try:
-    from main import PersonalFinanceChatbot
-    from utils import extract_amounts, format_currency
+    from backend.main import PersonalFinanceChatbot
+    from backend.utils import extract_amount_spans, format_currency
     BACKEND_AVAILABLE = True
 except ImportError:
     BACKEND_AVAILABLE = False
     print("Backend modules not available, running in demo mode")
 
 
+# Oldest lines are trimmed past this cap so Text-widget relayout and
+# see('end') stay constant-cost no matter how long the session runs
+_MAX_CHAT_LINES = 1000
+
+
+# Demo responses built once at import; dispatch tokenizes the message a
+# single time and intersects with pre-lowered keyword sets, matching the
+# other frontends
+_DEMO_RESPONSES = {
+    'budget': ("Creating a budget is essential for financial health! Here's a simple approach:\n\n"
+               "1. Track your income and expenses for a month\n"
+               "2. Use the 50/30/20 rule: 50% needs, 30% wants, 20% savings\n"
+               "3. Start with essential categories: housing, food, transportation\n"
+               "4. Set realistic savings goals\n\n"
+               "Would you like help with any specific budgeting category?"),
+    'invest': ("Great question about investing! For beginners, consider:\n\n"
+               "1. Start with an emergency fund (3-6 months expenses)\n"
+               "2. Consider low-cost index funds or ETFs\n"
+               "3. Take advantage of employer 401(k) matching\n"
+               "4. Diversify your portfolio\n"
+               "5. Think long-term and don't panic during market dips\n\n"
+               "Remember: invest only what you can afford to lose!"),
+    'debt': ("Managing debt effectively is crucial! Here's my advice:\n\n"
+             "1. List all debts with balances and interest rates\n"
+             "2. Pay minimums on all debts\n"
+             "3. Use debt avalanche (highest interest first) or snowball (smallest balance first)\n"
+             "4. Consider debt consolidation if it lowers rates\n"
+             "5. Avoid taking on new debt while paying off existing debt\n\n"
+             "Would you like help prioritizing your specific debts?"),
+}
+
+_DEFAULT_RESPONSE = ("Thanks for your question! I can help with:\n\n"
+                     "💰 Budgeting and expense tracking\n"
+                     "📈 Investment strategies and portfolio advice\n"
+                     "💳 Debt management and payoff strategies\n"
+                     "🏠 Saving for major purchases\n"
+                     "📊 Financial planning and goal setting\n\n"
+                     "What specific financial topic would you like to explore?")
+
+_TOPIC_KEYWORDS = (
+    ('budget', frozenset({'budget', 'budgeting'})),
+    ('invest', frozenset({'invest', 'investment'})),
+    ('debt', frozenset({'debt', 'loan'})),
+)
+
+_TOKEN_RE = re.compile(r"[a-z']+")
+
+# Quick-action buttons as (label, payload) pairs: the emoji prefix is
+# sliced off once at import instead of on every click
+_QUICK_ACTIONS = tuple(
+    (label, label.split(' ', 1)[1])
+    for label in (
+        "💰 Help me create a budget",
+        "📊 Investment advice for beginners",
+        "💳 Should I pay off debt first?",
+        "🏠 Saving for a house down payment",
+    )
+)
+
+
+# One chatbot per process: relaunching the GUI from the in-process
+# launcher reuses the already-authenticated backend clients
+_CHATBOT = None
+
+
+def _get_chatbot():
+    """Create the shared chatbot instance on first use"""
+    global _CHATBOT
+    if _CHATBOT is None:
+        _CHATBOT = PersonalFinanceChatbot()
+    return _CHATBOT
+
+
 class ModernChatGUI:
     def __init__(self, root):
         self.root = root
         self.setup_window()
         self.setup_styles()
         self.create_widgets()
+
+        # Message timestamps are minute-granular; cache the formatted
+        # string so strftime runs once a minute, not once a message.
+        # Must exist before setup_layout(), which posts the welcome
+        # message through add_message.
+        self._last_ts_min = -1
+        self._last_ts_str = ''
+
         self.setup_layout()
-        
+
+        # A single shared worker replaces a fresh thread per request;
+        # rapid quick-action clicks queue up instead of stacking
+        # threads that all contend on the backend clients. Workers hand
+        # results straight back via root.after(0, ...), so the GUI
+        # thread does zero work until a result actually arrives.
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix='chat'
+        )
+
+        # Each in-flight request gets its own typing-indicator marks so
+        # overlapping sends can't delete each other's text
+        self._typing_seq = 0
+        self.root.protocol('WM_DELETE_WINDOW', self._on_close)
+
         # Initialize chatbot
         if BACKEND_AVAILABLE:
-            self.chatbot = PersonalFinanceChatbot()
+            self.chatbot = _get_chatbot()
             self.check_api_status()
         else:
             self.chatbot = None
-            
-        # Threading for async operations
-        self.response_queue = queue.Queue()
-        self.root.after(100, self.check_response_queue)
         
     def setup_window(self):
         """Configure main window properties"""
@@ -83,6 +179,20 @@ class ModernChatGUI:
             borderwidth=1,
             insertcolor='#0084ff'
         )
+
+        # One shared style for the quick-action buttons instead of ten
+        # per-widget option configures on each of them
+        style.configure(
+            'Quick.TButton',
+            background='#e8f4fd',
+            foreground='#0084ff',
+            borderwidth=0,
+            focuscolor='none',
+            font=('Helvetica', 9),
+            padding=(4, 8)
+        )
+        style.map('Quick.TButton',
+                 background=[('active', '#d0e9ff')])
         
     def create_widgets(self):
         """Create all GUI widgets"""
@@ -124,9 +234,24 @@ class ModernChatGUI:
             selectbackground='#e3f2fd',
             relief='flat',
             padx=15,
-            pady=10
+            pady=10,
+            # No undo bookkeeping for a log nobody edits
+            undo=False,
+            autoseparators=False,
+            maxundo=0
         )
-        
+
+        # Text tags are configured once; re-running tag_configure per
+        # message was four wasted Tcl round-trips each time
+        self.chat_display.tag_configure("sender", font=('Helvetica', 10, 'bold'))
+        self.chat_display.tag_configure("timestamp", font=('Helvetica', 8), foreground='#888888')
+        self.chat_display.tag_configure("message", font=('Helvetica', 11))
+        self.chat_display.tag_configure("amount", foreground='#00a651', font=('Helvetica', 11, 'bold'))
+
+        # Read-only outside of our own bracketed inserts, so users
+        # can't type into the history
+        self.chat_display.configure(state='disabled')
+
         # Input frame
         self.input_frame = tk.Frame(self.main_frame, bg='#f0f2f5')
         
@@ -151,26 +276,13 @@ class ModernChatGUI:
         self.actions_frame = tk.Frame(self.main_frame, bg='#f0f2f5')
         
         self.quick_buttons = []
-        quick_actions = [
-            "💰 Help me create a budget",
-            "📊 Investment advice for beginners",
-            "💳 Should I pay off debt first?",
-            "🏠 Saving for a house down payment"
-        ]
-        
-        for i, action in enumerate(quick_actions):
-            btn = tk.Button(
+        for label, payload in _QUICK_ACTIONS:
+            btn = ttk.Button(
                 self.actions_frame,
-                text=action,
-                command=lambda a=action: self.quick_action(a),
-                bg='#e8f4fd',
-                fg='#0084ff',
-                border=0,
-                font=('Helvetica', 9),
+                text=label,
+                style='Quick.TButton',
                 cursor='hand2',
-                activebackground='#d0e9ff',
-                relief='flat',
-                pady=8
+                command=lambda p=payload: (self.message_var.set(p), self.send_message())
             )
             self.quick_buttons.append(btn)
             
@@ -210,70 +322,72 @@ class ModernChatGUI:
                         "#f0f8ff")
         
     def check_api_status(self):
-        """Check and display API connection status"""
-        def check_apis():
-            status_parts = []
-            
-            # Check OpenAI API
-            if hasattr(self.chatbot, 'openai_client') and self.chatbot.openai_client:
-                status_parts.append("🟢 OpenAI")
-            else:
-                status_parts.append("🔴 OpenAI")
-                
-            # Check Google NLU
-            if hasattr(self.chatbot, 'nlu_client') and self.chatbot.nlu_client:
-                status_parts.append("🟢 Google NLU")
-            else:
-                status_parts.append("🔴 Google NLU")
-                
-            status_text = " | ".join(status_parts)
-            self.response_queue.put(('status', status_text))
-            
-        if self.chatbot:
-            thread = threading.Thread(target=check_apis, daemon=True)
-            thread.start()
-        else:
+        """Check and display API connection status
+
+        The status is two attribute reads on constructor-set flags, so
+        it runs inline — the worker thread that used to be spawned cost
+        orders of magnitude more than the check itself.
+        """
+        if not self.chatbot:
             self.api_status_label.config(text="🔴 Demo Mode")
+            return
+
+        status_parts = []
+
+        # Check OpenAI API
+        if hasattr(self.chatbot, 'openai_client') and self.chatbot.openai_client:
+            status_parts.append("🟢 OpenAI")
+        else:
+            status_parts.append("🔴 OpenAI")
+
+        # Check Google NLU
+        if hasattr(self.chatbot, 'nlu_client') and self.chatbot.nlu_client:
+            status_parts.append("🟢 Google NLU")
+        else:
+            status_parts.append("🔴 Google NLU")
+
+        self.api_status_label.config(text=" | ".join(status_parts))
             
     def add_message(self, sender, message, bg_color="#ffffff"):
         """Add a message to the chat display with styling"""
-        timestamp = datetime.datetime.now().strftime("%H:%M")
-        
-        # Configure text tags for styling
-        self.chat_display.tag_configure("sender", font=('Helvetica', 10, 'bold'))
-        self.chat_display.tag_configure("timestamp", font=('Helvetica', 8), foreground='#888888')
-        self.chat_display.tag_configure("message", font=('Helvetica', 11))
-        self.chat_display.tag_configure("amount", foreground='#00a651', font=('Helvetica', 11, 'bold'))
-        
-        # Insert message
-        self.chat_display.insert('end', f"{sender}", "sender")
-        self.chat_display.insert('end', f" • {timestamp}\n", "timestamp")
-        
-        # Highlight financial amounts in the message
+        minute = int(time.time() // 60)
+        if minute != self._last_ts_min:
+            self._last_ts_min = minute
+            self._last_ts_str = datetime.datetime.now().strftime("%H:%M")
+        timestamp = self._last_ts_str
+
+        # Build one flat interleaved text/tag list; Text.insert accepts
+        # it as a single Tcl command, so the whole message is one
+        # round-trip instead of one per fragment
+        args = [sender, "sender", f" • {timestamp}\n", "timestamp"]
+
+        # Highlight financial amounts: walk the regex spans in order and
+        # slice the original text, one linear pass with whitespace intact
         if BACKEND_AVAILABLE:
-            amounts = extract_amounts(message)
-            if amounts:
-                words = message.split()
-                for word in words:
-                    if any(str(amount) in word.replace(',', '').replace('$', '') for amount in amounts):
-                        self.chat_display.insert('end', f"{word} ", "amount")
-                    else:
-                        self.chat_display.insert('end', f"{word} ", "message")
-            else:
-                self.chat_display.insert('end', message, "message")
+            cursor = 0
+            for start, end, _value in extract_amount_spans(message):
+                if start > cursor:
+                    args += (message[cursor:start], "message")
+                args += (message[start:end], "amount")
+                cursor = end
+            if cursor < len(message):
+                args += (message[cursor:], "message")
         else:
-            self.chat_display.insert('end', message, "message")
-            
-        self.chat_display.insert('end', "\n\n")
+            args += (message, "message")
+
+        args += ("\n\n", "message")
+        self.chat_display.configure(state='normal')
+        self.chat_display.insert('end', *args)
+
+        # Trim the oldest lines once the buffer outgrows the cap; the
+        # visible tail is all that matters for a chat log
+        lines = int(self.chat_display.index('end-1c').split('.')[0])
+        if lines > _MAX_CHAT_LINES:
+            self.chat_display.delete('1.0', f'{lines - _MAX_CHAT_LINES + 1}.0')
+
+        self.chat_display.configure(state='disabled')
         self.chat_display.see('end')
         
-    def quick_action(self, action):
-        """Handle quick action button clicks"""
-        # Remove emoji and send as message
-        clean_action = action.split(' ', 1)[1] if ' ' in action else action
-        self.message_var.set(clean_action)
-        self.send_message()
-        
     def send_message(self):
         """Send message and get response"""
         user_message = self.message_var.get().strip()
@@ -284,9 +398,17 @@ class ModernChatGUI:
         self.add_message("You", user_message, "#e3f2fd")
         self.message_var.set("")
         
-        # Show typing indicator
+        # Show typing indicator, bracketed by a per-request pair of
+        # marks so removal is a single mark-to-mark delete and
+        # overlapping requests never touch each other's indicator
+        self._typing_seq += 1
+        mark = f'typing_{self._typing_seq}'
+        self.chat_display.mark_set(mark, 'end-1c')
+        self.chat_display.mark_gravity(mark, 'left')
         self.add_message("Assistant", "Typing...", "#f0f8ff")
-        
+        self.chat_display.mark_set(f'{mark}_end', 'end-1c')
+        self.chat_display.mark_gravity(f'{mark}_end', 'left')
+
         # Get response in background thread
         def get_response():
             try:
@@ -295,80 +417,61 @@ class ModernChatGUI:
                 else:
                     # Demo response
                     response = self.get_demo_response(user_message)
-                    
-                self.response_queue.put(('response', response))
+
+                self._post(self._on_response, mark, response)
             except Exception as e:
-                self.response_queue.put(('error', str(e)))
-                
-        thread = threading.Thread(target=get_response, daemon=True)
-        thread.start()
+                self._post(self._on_error, mark, str(e))
+
+        self._executor.submit(get_response)
         
     def get_demo_response(self, message):
         """Generate demo responses when backend isn't available"""
-        message_lower = message.lower()
-        
-        if any(word in message_lower for word in ['budget', 'budgeting']):
-            return ("Creating a budget is essential for financial health! Here's a simple approach:\n\n"
-                   "1. Track your income and expenses for a month\n"
-                   "2. Use the 50/30/20 rule: 50% needs, 30% wants, 20% savings\n"
-                   "3. Start with essential categories: housing, food, transportation\n"
-                   "4. Set realistic savings goals\n\n"
-                   "Would you like help with any specific budgeting category?")
-                   
-        elif any(word in message_lower for word in ['invest', 'investment']):
-            return ("Great question about investing! For beginners, consider:\n\n"
-                   "1. Start with an emergency fund (3-6 months expenses)\n"
-                   "2. Consider low-cost index funds or ETFs\n"
-                   "3. Take advantage of employer 401(k) matching\n"
-                   "4. Diversify your portfolio\n"
-                   "5. Think long-term and don't panic during market dips\n\n"
-                   "Remember: invest only what you can afford to lose!")
-                   
-        elif any(word in message_lower for word in ['debt', 'loan']):
-            return ("Managing debt effectively is crucial! Here's my advice:\n\n"
-                   "1. List all debts with balances and interest rates\n"
-                   "2. Pay minimums on all debts\n"
-                   "3. Use debt avalanche (highest interest first) or snowball (smallest balance first)\n"
-                   "4. Consider debt consolidation if it lowers rates\n"
-                   "5. Avoid taking on new debt while paying off existing debt\n\n"
-                   "Would you like help prioritizing your specific debts?")
+        tokens = frozenset(_TOKEN_RE.findall(message.casefold()))
+        for topic, keywords in _TOPIC_KEYWORDS:
+            if tokens & keywords:
+                return _DEMO_RESPONSES[topic]
+        return _DEFAULT_RESPONSE
                    
-        else:
-            return ("Thanks for your question! I can help with:\n\n"
-                   "💰 Budgeting and expense tracking\n"
-                   "📈 Investment strategies and portfolio advice\n"
-                   "💳 Debt management and payoff strategies\n"
-                   "🏠 Saving for major purchases\n"
-                   "📊 Financial planning and goal setting\n\n"
-                   "What specific financial topic would you like to explore?")
-                   
-    def check_response_queue(self):
-        """Check for responses from background threads"""
+    def _on_close(self):
+        """Stop the worker pool before tearing down the window"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.root.destroy()
+
+    def _post(self, callback, *args):
+        """Schedule a UI callback from a worker thread
+
+        Tk's after() is safe to call from other threads on CPython, so
+        results reach the GUI directly with no queue or polling loop.
+        """
         try:
-            while True:
-                response_type, data = self.response_queue.get_nowait()
-                
-                if response_type == 'response':
-                    # Remove typing indicator
-                    self.chat_display.delete('end-3l', 'end-1l')
-                    # Add actual response
-                    self.add_message("Assistant", data, "#f0f8ff")
-                    
-                elif response_type == 'error':
-                    self.chat_display.delete('end-3l', 'end-1l')
-                    self.add_message("Assistant", 
-                                   f"Sorry, I encountered an error: {data}\n"
-                                   "Please try again or check your API configuration.",
-                                   "#ffe6e6")
-                                   
-                elif response_type == 'status':
-                    self.api_status_label.config(text=data)
-                    
-        except queue.Empty:
+            self.root.after(0, callback, *args)
+        except (tk.TclError, RuntimeError):
+            # Window already destroyed; nothing left to update
             pass
-            
-        # Schedule next check
-        self.root.after(100, self.check_response_queue)
+
+    def _remove_typing_indicator(self, mark):
+        """Delete one request's 'Typing...' placeholder
+
+        Only the text between the request's own marks goes, so messages
+        added after the indicator are untouched.
+        """
+        self.chat_display.configure(state='normal')
+        self.chat_display.delete(mark, f'{mark}_end')
+        self.chat_display.configure(state='disabled')
+        self.chat_display.mark_unset(mark, f'{mark}_end')
+
+    def _on_response(self, mark, data):
+        """Show an assistant response, replacing the typing indicator"""
+        self._remove_typing_indicator(mark)
+        self.add_message("Assistant", data, "#f0f8ff")
+
+    def _on_error(self, mark, data):
+        """Show a worker error, replacing the typing indicator"""
+        self._remove_typing_indicator(mark)
+        self.add_message("Assistant",
+                       f"Sorry, I encountered an error: {data}\n"
+                       "Please try again or check your API configuration.",
+                       "#ffe6e6")
 
 
 def main():
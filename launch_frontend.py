@@ -4,13 +4,19 @@ Personal Finance Chatbot - Frontend Launcher
 Interactive launcher to choose and run different Python frontends
 """
 
+import functools
 import sys
 import os
 import subprocess
 import importlib.util
 
+@functools.lru_cache(maxsize=None)
 def check_module(module_name):
-    """Check if a module is available"""
+    """Check if a module is available
+
+    find_spec walks sys.path and stats directories, so the result is
+    cached — availability doesn't change within a launcher session.
+    """
     spec = importlib.util.find_spec(module_name)
     return spec is not None
 
@@ -80,28 +86,36 @@ def print_menu(available):
     print()
 
 def run_frontend(choice, available):
-    """Run the selected frontend"""
+    """Run the selected frontend
+
+    The Python frontends are dispatched in-process — no interpreter
+    fork, and backend modules stay warm when trying another frontend.
+    Streamlit keeps its subprocess because it needs its own CLI.
+    """
     if choice == '1' and available['tkinter']:
         print("🚀 Launching Tkinter Desktop App...")
         try:
-            subprocess.run([sys.executable, 'frontend/tkinter_app.py'])
+            from frontend.tkinter_app import main as tkinter_main
+            tkinter_main()
         except KeyboardInterrupt:
             print("\n👋 Tkinter app closed.")
         return True
-        
+
     elif choice == '2' and available['fastapi']:
         print("🚀 Launching FastAPI Web App...")
         print("📱 Open your browser to: http://localhost:8000")
         try:
-            subprocess.run([sys.executable, 'frontend/fastapi_frontend.py'])
+            from frontend.fastapi_frontend import main as fastapi_main
+            fastapi_main()
         except KeyboardInterrupt:
             print("\n👋 FastAPI server stopped.")
         return True
-        
+
     elif choice == '3' and available['kivy']:
         print("🚀 Launching Kivy Mobile App...")
         try:
-            subprocess.run([sys.executable, 'frontend/kivy_mobile_app.py'])
+            from frontend.kivy_mobile_app import main as kivy_main
+            kivy_main()
         except KeyboardInterrupt:
             print("\n👋 Kivy app closed.")
         return True
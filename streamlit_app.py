@@ -22,22 +22,36 @@ st.set_page_config(
     layout="wide"
 )
 
-# Initialize handlers
-@st.cache_resource
-def initialize_handlers():
-    return {
-        'openai': OpenAIHandler(),
-        'google_nlu': GoogleNLUHandler(),
-        'utils': FinanceUtils()
-    }
+# Each handler is constructed lazily on first use and cached for the
+# session, so first paint never waits on the slowest client's setup
+@st.cache_resource(show_spinner=False)
+def get_openai():
+    return OpenAIHandler()
+
+@st.cache_resource(show_spinner=False)
+def get_google_nlu():
+    return GoogleNLUHandler()
+
+@st.cache_resource(show_spinner=False)
+def get_utils():
+    return FinanceUtils()
+
+@st.fragment
+def render_history():
+    """Replay the stored chat history
+
+    As a fragment, reruns triggered from inside other fragments skip
+    this loop, so a long conversation isn't re-rendered on every
+    interaction that doesn't touch it.
+    """
+    for message in st.session_state.messages:
+        with st.chat_message(message["role"]):
+            st.markdown(message["content"])
 
 def main():
     st.title("💰 Personal Finance Chatbot")
     st.markdown("Welcome to your personal finance assistant!")
     
-    # Initialize handlers
-    handlers = initialize_handlers()
-    
     # Sidebar with app info
     with st.sidebar:
         st.header("About")
@@ -52,8 +66,8 @@ def main():
         
         # Check API status
         st.header("API Status")
-        openai_status = "✅ Connected" if handlers['openai'].api_key else "❌ Not configured"
-        google_status = "✅ Connected" if handlers['google_nlu'].client else "❌ Not configured"
+        openai_status = "✅ Connected" if get_openai().api_key else "❌ Not configured"
+        google_status = "✅ Connected" if get_google_nlu().client else "❌ Not configured"
         
         st.write(f"OpenAI: {openai_status}")
         st.write(f"Google NLU: {google_status}")
@@ -63,9 +77,7 @@ def main():
         st.session_state.messages = []
     
     # Display chat messages from history on app rerun
-    for message in st.session_state.messages:
-        with st.chat_message(message["role"]):
-            st.markdown(message["content"])
+    render_history()
     
     # Accept user input
     if prompt := st.chat_input("Ask me about your finances..."):
@@ -80,18 +92,18 @@ def main():
         with st.chat_message("assistant"):
             with st.spinner("Thinking..."):
                 # Analyze sentiment
-                sentiment_result = handlers['google_nlu'].analyze_sentiment(prompt)
+                sentiment_result = get_google_nlu().analyze_sentiment(prompt)
                 
                 # Generate response using OpenAI
-                if handlers['openai'].api_key:
-                    response = handlers['openai'].get_financial_advice(prompt)
+                if get_openai().api_key:
+                    response = get_openai().get_financial_advice(prompt)
                 else:
                     response = "I'd love to help with your financial question, but the OpenAI API is not configured. Please check your environment variables."
                 
                 # Extract any financial amounts for analysis
-                amounts = handlers['utils'].extract_amounts(prompt)
+                amounts = get_utils().extract_amounts(prompt)
                 if amounts:
-                    amounts_str = ", ".join([handlers['utils'].format_currency(amt) for amt in amounts])
+                    amounts_str = ", ".join([get_utils().format_currency(amt) for amt in amounts])
                     response += f"\n\n💰 I noticed these amounts in your question: {amounts_str}"
                 
                 # Add sentiment info if available
@@ -2,39 +2,44 @@
 Simple tests for the personal finance chatbot
 """
 
-import sys
-sys.path.append('./backend')
+import pytest
 
-from backend.utils import FinanceUtils
+# Each behavior gets one parametrized test; the shared FinanceUtils
+# instance comes from the session-scoped `utils` fixture in conftest.py
 
-def test_utils():
-    """Test utility functions"""
-    utils = FinanceUtils()
-    
-    # Test amount extraction
-    test_text = "I want to invest $5000 in stocks and save $2,500 for retirement"
-    amounts = utils.extract_amounts(test_text)
-    assert 5000.0 in amounts
-    assert 2500.0 in amounts
-    print(f"✅ Amount extraction test passed: {amounts}")
-    
-    # Test currency formatting
-    formatted = utils.format_currency(1234.56)
-    assert formatted == "$1,234.56"
-    print(f"✅ Currency formatting test passed: {formatted}")
-    
-    # Test expense categorization
-    food_expense = "Lunch at restaurant downtown"
-    category = utils.categorize_expense(food_expense)
-    assert category == "food"
-    print(f"✅ Expense categorization test passed: {category}")
-    
-    # Test compound interest calculation
-    result = utils.calculate_compound_interest(1000, 0.05, 10)
-    expected = 1000 * (1.05 ** 10)  # Simplified for annual compounding
-    print(f"✅ Compound interest calculation: ${result}")
-    
-    print("All tests passed! 🎉")
+@pytest.mark.parametrize("text, expected", [
+    ("I want to invest $5000 in stocks and save $2,500 for retirement", [5000.0, 2500.0]),
+    ("My rent is $1,200.50 per month", [1200.50]),
+    ("no amounts mentioned here", []),
+])
+def test_extract_amounts(utils, text, expected):
+    assert utils.extract_amounts(text) == expected
+
+@pytest.mark.parametrize("amount, expected", [
+    (1234.56, "$1,234.56"),
+    (0, "$0.00"),
+    (1000000, "$1,000,000.00"),
+])
+def test_format_currency(utils, amount, expected):
+    assert utils.format_currency(amount) == expected
+
+@pytest.mark.parametrize("text, expected", [
+    ("Lunch at restaurant downtown", "food"),
+    ("Uber ride to the airport", "transportation"),
+    ("Monthly electric and internet payment", "utilities"),
+    ("Mystery purchase", "other"),
+])
+def test_categorize_expense(utils, text, expected):
+    assert utils.categorize_expense(text) == expected
+
+@pytest.mark.parametrize("principal, rate, time, frequency, expected", [
+    (1000, 0.05, 10, 1, 1000 * (1.05 ** 10)),
+    (1000, 0.0, 10, 12, 1000.0),
+    (2500, 0.07, 5, 12, 2500 * (1 + 0.07 / 12) ** 60),
+])
+def test_calculate_compound_interest(utils, principal, rate, time, frequency, expected):
+    result = utils.calculate_compound_interest(principal, rate, time, frequency)
+    assert result == pytest.approx(expected, abs=0.01)
 
 if __name__ == "__main__":
-    test_utils()
+    raise SystemExit(pytest.main([__file__, "-q"]))